@@ -330,6 +330,31 @@ class ProgressionTracker:
         self.save_srs_item(script, item)
         return new_stage
 
+    def record_character_answers(self, script: str, item_ids: List[str], correct: bool) -> None:
+        """
+        Record the same answer for several characters in one pass.
+
+        Equivalent to calling :meth:`record_character_answer` per item, with
+        the script dict and difficulty settings looked up once.
+        """
+        mc = self._data.setdefault("mastered_characters", {})
+        script_dict = mc.setdefault(script, {})
+        consecutive_to_master = self._diff_settings["consecutive_correct_to_master"]
+        srs_interval_mult = self._diff_settings["srs_interval_mult"]
+
+        for item_id in item_ids:
+            info = script_dict.get(item_id)
+            if isinstance(info, dict):
+                item = SRSItem.from_dict(item_id, info)
+            else:
+                item = SRSItem(item_id=item_id)
+            item.record_answer(
+                correct=correct,
+                consecutive_to_master=consecutive_to_master,
+                srs_interval_mult=srs_interval_mult,
+            )
+            script_dict[item_id] = item.to_dict()
+
     # ---- Due items ----------------------------------------------------------
 
     def get_due_items(self, script: str, limit: int = 20) -> List[SRSItem]:
@@ -2,23 +2,57 @@
 Nihongo Quest - Save System
 ============================
 Robust JSON-based save/load system with 6 save slots.
-Saves are stored in the user's local application data directory.
+Saves are stored gzip-compressed in the user's local application data
+directory; plain ``.json`` saves from older versions are still read and are
+migrated on their next save.
 Handles corruption, missing files, and partial data gracefully.
 """
 
+import copy
+import gzip
 import json
+import operator
 import os
 import shutil
+import sys
+import threading
 import time
 import logging
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 # Use project config for paths and limits
-from config import SAVE_DIR, MAX_SAVE_SLOTS, DEFAULT_DIFFICULTY
+from config import SAVE_DIR, MAX_SAVE_SLOTS, DEFAULT_DIFFICULTY, DIFFICULTY_SETTINGS
 
 logger = logging.getLogger(__name__)
 
+# Enum-like string values that repeat many times in a save file (SRS stage
+# names, difficulty keys, script names).  Interned on load so duplicates
+# share one object instead of a fresh str per occurrence.
+_INTERNED_VALUES = frozenset(
+    {"new", "learning", "review", "mastered", "hiragana", "katakana", "kanji"}
+    | set(DIFFICULTY_SETTINGS)
+)
+
+# Field groups checked by _validate_save_data()
+_MC_SUBKEYS = ("hiragana", "katakana", "kanji")
+_LIST_KEYS = frozenset({"completed_lessons", "completed_minigames",
+                        "vocabulary_learned", "grammar_learned"})
+_NUMERIC_DEFAULTS = (("total_play_time", (int, float), 0.0),
+                     ("current_monument", int, 0))
+
+# Background writer for save_game_async(): one worker keeps writes ordered,
+# and at most one queued write per slot carries the newest snapshot.
+_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+_in_flight: Dict[int, Future] = {}
+_pending_payloads: Dict[int, Dict[str, Any]] = {}
+_in_flight_lock = threading.Lock()
+
+# (timestamp, iso-string) of the last ``last_played`` stamp; see _now_iso().
+_last_iso_cache = (0.0, "")
+
 
 # ---------------------------------------------------------------------------
 # Default save data template
@@ -58,33 +92,84 @@ def _default_save_data(slot: int) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 def _slot_filename(slot: int) -> str:
-    """Return the JSON filename for a given slot number."""
-    return f"save_slot_{slot}.json"
+    """Return the compressed JSON filename for a given slot number."""
+    return f"save_slot_{slot}.json.gz"
+
+
+# zlib level 1: saves are small and repetitive, so the fastest level already
+# shrinks them several times over.
+_COMPRESS_LEVEL = 1
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Per-slot file paths, built once at import and indexed by ``slot - 1``.
+_SLOT_RANGE = range(1, MAX_SAVE_SLOTS + 1)
+_PRIMARY_PATHS = tuple(os.path.join(SAVE_DIR, _slot_filename(i)) for i in _SLOT_RANGE)
+_BACKUP_PATHS = tuple(os.path.join(SAVE_DIR, f"save_slot_{i}.bak.json.gz") for i in _SLOT_RANGE)
+_TMP_PATHS = tuple(path + ".tmp" for path in _PRIMARY_PATHS)
+
+# Uncompressed files written by older versions (read-only, removed on save)
+_LEGACY_PATHS = tuple(os.path.join(SAVE_DIR, f"save_slot_{i}.json") for i in _SLOT_RANGE)
+_LEGACY_BACKUP_PATHS = tuple(os.path.join(SAVE_DIR, f"save_slot_{i}.bak.json") for i in _SLOT_RANGE)
 
 
 def _slot_filepath(slot: int) -> str:
     """Return the full file path for a given slot number."""
-    return os.path.join(SAVE_DIR, _slot_filename(slot))
+    return _PRIMARY_PATHS[slot - 1]
 
 
 def _backup_filepath(slot: int) -> str:
     """Return the path of the backup file for a slot."""
-    return os.path.join(SAVE_DIR, f"save_slot_{slot}.bak.json")
+    return _BACKUP_PATHS[slot - 1]
+
+
+def _read_save_file(path: str) -> Any:
+    """Read and decode a save file, transparently handling gzip or plain JSON."""
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    if raw[:2] == _GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    return json.loads(raw.decode("utf-8"), object_hook=_intern_hook)
 
 
 def _validate_slot(slot: int) -> None:
     """Raise ValueError if the slot number is out of range."""
-    if not isinstance(slot, int) or slot < 1 or slot > MAX_SAVE_SLOTS:
+    try:
+        index = operator.index(slot)
+    except TypeError:
+        index = 0
+    if not 1 <= index <= MAX_SAVE_SLOTS:
         raise ValueError(
             f"Invalid save slot {slot!r}. Must be an integer between 1 and {MAX_SAVE_SLOTS}."
         )
 
 
+def _now_iso() -> str:
+    """
+    Return the current UTC time as an ISO-8601 string.
+
+    The formatted value is reused for up to one second so that bursts of
+    saves do not each build a tz-aware datetime and format it.
+    """
+    global _last_iso_cache
+    now = time.time()
+    if now - _last_iso_cache[0] > 1.0:
+        _last_iso_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _last_iso_cache[1]
+
+
 def _ensure_save_directory() -> None:
     """Create the save directory tree if it does not already exist."""
     os.makedirs(SAVE_DIR, exist_ok=True)
 
 
+def _intern_hook(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """``json`` object hook that interns known enum-like string values."""
+    for key, value in obj.items():
+        if type(value) is str and value in _INTERNED_VALUES:
+            obj[key] = sys.intern(value)
+    return obj
+
+
 def _validate_save_data(data: Dict[str, Any], slot: int) -> Dict[str, Any]:
     """
     Validate and repair loaded save data.
@@ -106,21 +191,19 @@ def _validate_save_data(data: Dict[str, Any], slot: int) -> Dict[str, Any]:
     if not isinstance(mc, dict):
         data["mastered_characters"] = template["mastered_characters"]
     else:
-        for sub_key in ("hiragana", "katakana", "kanji"):
+        for sub_key in _MC_SUBKEYS:
             if sub_key not in mc or not isinstance(mc[sub_key], dict):
                 mc[sub_key] = {}
 
     # Ensure list fields are actually lists
-    for list_key in ("completed_lessons", "completed_minigames",
-                     "vocabulary_learned", "grammar_learned"):
+    for list_key in _LIST_KEYS:
         if not isinstance(data.get(list_key), list):
             data[list_key] = []
 
     # Ensure numeric fields are numeric
-    if not isinstance(data.get("total_play_time"), (int, float)):
-        data["total_play_time"] = 0.0
-    if not isinstance(data.get("current_monument"), int):
-        data["current_monument"] = 0
+    for num_key, num_types, num_default in _NUMERIC_DEFAULTS:
+        if not isinstance(data.get(num_key), num_types):
+            data[num_key] = num_default
 
     # Force the slot field to match the requested slot
     data["slot"] = slot
@@ -157,24 +240,44 @@ def save_game(slot: int, data: Dict[str, Any]) -> bool:
 
     # Stamp metadata
     data["slot"] = slot
-    data["last_played"] = datetime.now(timezone.utc).isoformat()
+    data["last_played"] = _now_iso()
 
-    # If an existing save is present, create a backup first
-    if os.path.isfile(filepath):
+    legacy = _LEGACY_PATHS[slot - 1]
+
+    # If an existing save is present (compressed or legacy), create a backup first
+    source = filepath if os.path.isfile(filepath) else legacy
+    if os.path.isfile(source):
         try:
-            shutil.copy2(filepath, backup)
+            shutil.copy2(source, backup)
         except OSError as exc:
             logger.warning("Could not create backup for slot %d: %s", slot, exc)
 
     # Write to a temporary file, then atomically rename to avoid half-writes
-    tmp_path = filepath + ".tmp"
+    tmp_path = _TMP_PATHS[slot - 1]
     try:
-        with open(tmp_path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2, ensure_ascii=False)
+        payload = gzip.compress(
+            json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+            compresslevel=_COMPRESS_LEVEL,
+        )
+        with open(tmp_path, "wb") as fh:
+            fh.write(payload)
+            # Flush to disk before the rename so a crash can't leave the
+            # slot pointing at an empty / truncated file
+            fh.flush()
+            os.fsync(fh.fileno())
 
         # Atomic replace (works on Windows with os.replace since Python 3.3)
         os.replace(tmp_path, filepath)
         logger.info("Game saved to slot %d.", slot)
+
+        # The compressed save supersedes any pre-compression files
+        for old_path in (legacy, _LEGACY_BACKUP_PATHS[slot - 1]):
+            try:
+                os.unlink(old_path)
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                logger.warning("Could not remove legacy save %s: %s", old_path, exc)
         return True
 
     except (OSError, TypeError, ValueError) as exc:
@@ -188,6 +291,53 @@ def save_game(slot: int, data: Dict[str, Any]) -> bool:
         return False
 
 
+def _run_pending_save(slot: int) -> bool:
+    """Executor job: write the newest pending snapshot for *slot*, if any."""
+    with _in_flight_lock:
+        data = _pending_payloads.pop(slot, None)
+    if data is None:
+        # An earlier job already wrote the snapshot this one was queued for
+        return True
+    return save_game(slot, data)
+
+
+def save_game_async(slot: int, data: Dict[str, Any]) -> "Future[bool]":
+    """
+    Persist game data on the background save thread.
+
+    ``data`` is deep-copied immediately, so the caller may keep mutating it.
+    If a write for the same slot is still queued, its payload is replaced
+    with this snapshot instead of queuing another write.
+
+    Parameters
+    ----------
+    slot : int
+        Slot number (1 through MAX_SAVE_SLOTS).
+    data : dict
+        Game-state dictionary.  ``slot`` and ``last_played`` are stamped
+        on it before the snapshot is taken.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Resolves to the ``bool`` result of :func:`save_game`.
+    """
+    _validate_slot(slot)
+
+    data["slot"] = slot
+    data["last_played"] = _now_iso()
+    snapshot = copy.deepcopy(data)
+
+    with _in_flight_lock:
+        _pending_payloads[slot] = snapshot
+        future = _in_flight.get(slot)
+        if future is not None and not (future.running() or future.done()):
+            return future
+        future = _save_executor.submit(_run_pending_save, slot)
+        _in_flight[slot] = future
+        return future
+
+
 def load_game(slot: int) -> Optional[Dict[str, Any]]:
     """
     Load game data from the given save slot.
@@ -206,17 +356,28 @@ def load_game(slot: int) -> Optional[Dict[str, Any]]:
         The save-data dictionary, or ``None`` if no valid save exists.
     """
     _validate_slot(slot)
+    return _load_slot(slot, None)
 
-    filepath = _slot_filepath(slot)
-    backup = _backup_filepath(slot)
 
-    # Try primary, then backup
-    for path, label in ((filepath, "primary"), (backup, "backup")):
-        if not os.path.isfile(path):
+def _load_slot(slot: int, present: Optional[frozenset]) -> Optional[Dict[str, Any]]:
+    """
+    :func:`load_game` body.  ``present`` is the set of save-file paths known
+    to exist (from one directory scan), or ``None`` to stat each candidate.
+    """
+    index = slot - 1
+    candidates = (
+        (_PRIMARY_PATHS[index], "primary"),
+        (_LEGACY_PATHS[index], "primary"),
+        (_BACKUP_PATHS[index], "backup"),
+        (_LEGACY_BACKUP_PATHS[index], "backup"),
+    )
+
+    # Try primary, then backup (compressed first, then legacy plain JSON)
+    for path, label in candidates:
+        if not (os.path.isfile(path) if present is None else path in present):
             continue
         try:
-            with open(path, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = _read_save_file(path)
             if not isinstance(data, dict):
                 raise ValueError(f"Top-level JSON is {type(data).__name__}, expected dict.")
             data = _validate_save_data(data, slot)
@@ -229,7 +390,8 @@ def load_game(slot: int) -> Optional[Dict[str, Any]]:
 
             return data
 
-        except (json.JSONDecodeError, ValueError, KeyError, TypeError) as exc:
+        except (json.JSONDecodeError, ValueError, KeyError, TypeError,
+                gzip.BadGzipFile, zlib.error, EOFError) as exc:
             logger.warning("Corrupt %s save for slot %d: %s", label, slot, exc)
             continue
 
@@ -239,7 +401,7 @@ def load_game(slot: int) -> Optional[Dict[str, Any]]:
 
 def delete_save(slot: int) -> bool:
     """
-    Delete all save files (primary + backup) for the given slot.
+    Delete all save files (primary + backup, plus any legacy copies) for the given slot.
 
     Parameters
     ----------
@@ -254,13 +416,17 @@ def delete_save(slot: int) -> bool:
     _validate_slot(slot)
 
     removed_any = False
-    for path in (_slot_filepath(slot), _backup_filepath(slot)):
-        if os.path.isfile(path):
-            try:
-                os.remove(path)
-                removed_any = True
-            except OSError as exc:
-                logger.error("Could not delete %s: %s", path, exc)
+    index = slot - 1
+    for path in (_PRIMARY_PATHS[index], _BACKUP_PATHS[index],
+                 _LEGACY_PATHS[index], _LEGACY_BACKUP_PATHS[index]):
+        # Unlink directly instead of stat-then-remove (one syscall, no TOCTOU)
+        try:
+            os.unlink(path)
+            removed_any = True
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.error("Could not delete %s: %s", path, exc)
 
     if removed_any:
         logger.info("Deleted save slot %d.", slot)
@@ -281,7 +447,7 @@ def does_save_exist(slot: int) -> bool:
     bool
     """
     _validate_slot(slot)
-    return os.path.isfile(_slot_filepath(slot))
+    return os.path.isfile(_slot_filepath(slot)) or os.path.isfile(_LEGACY_PATHS[slot - 1])
 
 
 def get_all_saves() -> Dict[int, Optional[Dict[str, Any]]]:
@@ -293,10 +459,17 @@ def get_all_saves() -> Dict[int, Optional[Dict[str, Any]]]:
     dict[int, dict | None]
         Keys are slot numbers 1 through MAX_SAVE_SLOTS.
     """
+    # One directory scan instead of stat'ing up to four candidates per slot
+    try:
+        with os.scandir(SAVE_DIR) as entries:
+            present = frozenset(entry.path for entry in entries if entry.is_file())
+    except OSError:
+        present = frozenset()
+
     result: Dict[int, Optional[Dict[str, Any]]] = {}
     for slot in range(1, MAX_SAVE_SLOTS + 1):
         try:
-            result[slot] = load_game(slot)
+            result[slot] = _load_slot(slot, present)
         except Exception as exc:
             logger.error("Unexpected error loading slot %d: %s", slot, exc)
             result[slot] = None
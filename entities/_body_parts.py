@@ -0,0 +1,77 @@
+from ursina import *
+import math
+
+
+# ─────────────────────────────────────────────────────────────
+# Part colors shared by the player and every NPC
+# ─────────────────────────────────────────────────────────────
+FOOT_COLOR = color.rgb(80, 50, 30)
+HAIR_TIE_COLOR = color.rgb(200, 50, 50)
+
+# Spiky hair: eight spikes in a ring around the crown, every 45 degrees —
+# (x, y, z, rotation_z) per spike; the rotation leans the spike outward.
+SPIKE_OFFSETS = tuple(
+    (math.sin(rad) * 0.35, 0.55, math.cos(rad) * 0.35,
+     -math.degrees(math.atan2(math.sin(rad), 1)) * 0.5)
+    for rad in (math.radians(angle) for angle in range(0, 360, 45))
+)
+
+
+# ─────────────────────────────────────────────────────────────
+# Static part builders
+# ─────────────────────────────────────────────────────────────
+# Each builder parents plain Entities under ``root`` (a detached prefab
+# NodePath or a head / arm / leg), ready to be flattened by the caller.
+
+def build_hand(root, skin):
+    """Hand at the end of an arm, in arm-local coordinates."""
+    Entity(parent=root, model='sphere', color=skin,
+           scale=(0.6, 0.3, 0.6), position=(0, -0.55, 0),
+           add_to_scene_entities=False)
+
+
+def build_foot(root):
+    """Foot at the bottom of a leg, in leg-local coordinates."""
+    Entity(parent=root, model='cube', color=FOOT_COLOR,
+           scale=(0.8, 0.25, 1.2), position=(0, -0.55, 0.05),
+           add_to_scene_entities=False)
+
+
+def build_hair(root, hair_col, hair_style, lean_spikes=True):
+    """Hair geometry for ``hair_style``, in head-local coordinates."""
+    if hair_style == 'short':
+        Entity(parent=root, model='sphere', color=hair_col,
+               scale=(1.08, 0.6, 1.05), position=(0, 0.3, -0.05),
+               add_to_scene_entities=False)
+    elif hair_style == 'long':
+        Entity(parent=root, model='sphere', color=hair_col,
+               scale=(1.1, 0.6, 1.1), position=(0, 0.3, -0.05),
+               add_to_scene_entities=False)
+        Entity(parent=root, model='cube', color=hair_col,
+               scale=(0.85, 1.6, 0.4), position=(0, -0.3, -0.35),
+               add_to_scene_entities=False)
+    elif hair_style == 'spiky':
+        Entity(parent=root, model='sphere', color=hair_col,
+               scale=(1.15, 0.75, 1.1), position=(0, 0.35, -0.05),
+               add_to_scene_entities=False)
+        # Spikes (NPCs keep theirs upright)
+        for x, y, z, rot_z in SPIKE_OFFSETS:
+            Entity(parent=root, model='cube', color=hair_col,
+                   scale=(0.12, 0.3, 0.12), position=(x, y, z),
+                   rotation=(0, 0, rot_z if lean_spikes else 0),
+                   add_to_scene_entities=False)
+    elif hair_style == 'ponytail':
+        Entity(parent=root, model='sphere', color=hair_col,
+               scale=(1.08, 0.55, 1.05), position=(0, 0.3, -0.05),
+               add_to_scene_entities=False)
+        Entity(parent=root, model='sphere', color=HAIR_TIE_COLOR,
+               scale=(0.2, 0.2, 0.2), position=(0, 0.15, -0.5),
+               add_to_scene_entities=False)
+        Entity(parent=root, model='cube', color=hair_col,
+               scale=(0.25, 1.0, 0.2), position=(0, -0.4, -0.5),
+               add_to_scene_entities=False)
+    else:
+        # Default / bald-ish
+        Entity(parent=root, model='sphere', color=hair_col,
+               scale=(1.05, 0.4, 1.02), position=(0, 0.35, -0.05),
+               add_to_scene_entities=False)
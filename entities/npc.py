@@ -1,373 +1,476 @@
 from ursina import *
+from panda3d.core import NodePath, RigidBodyCombiner
+from dataclasses import dataclass, field, fields
+from entities._body_parts import build_foot, build_hair, build_hand
 import math
 
 
+# ─────────────────────────────────────────────────────────────
+# Default / fixed part colors — built once, shared by every NPC
+# ─────────────────────────────────────────────────────────────
+_DEFAULT_SKIN = color.rgb(240, 210, 175)
+_DEFAULT_HAIR = color.rgb(230, 230, 235)
+_DEFAULT_EYE = color.rgb(60, 50, 40)
+_DEFAULT_OUTFIT = color.rgb(60, 60, 90)
+_DEFAULT_ACCENT = color.rgb(180, 160, 120)
+_DEFAULT_LEG_COLOR = color.rgb(40, 40, 55)
+
+
 # ─────────────────────────────────────────────────────────────
 # Preset NPC definitions
 # ─────────────────────────────────────────────────────────────
+@dataclass(frozen=True, slots=True)
+class NPCPreset:
+    """Immutable NPC look + dialog template, shared by every NPC built from it."""
+    name: str = 'NPC'
+    name_jp: str = ''
+    skin_color: object = field(default_factory=lambda: _DEFAULT_SKIN)
+    hair_color: object = field(default_factory=lambda: _DEFAULT_HAIR)
+    hair_style: str = 'short'
+    eye_color: object = field(default_factory=lambda: _DEFAULT_EYE)
+    outfit_color: object = field(default_factory=lambda: _DEFAULT_OUTFIT)
+    outfit_accent: object = field(default_factory=lambda: _DEFAULT_ACCENT)
+    indicator: str = '!'
+    indicator_color: object = field(default_factory=lambda: color.yellow)
+    dialog: tuple = ()
+    display_name: str = field(init=False, default='')   # name tag text, formatted once
+
+    def __post_init__(self):
+        name = f'{self.name}  {self.name_jp}' if self.name_jp else self.name
+        object.__setattr__(self, 'display_name', name)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a preset from a custom npc_data dict, ignoring unknown keys."""
+        kwargs = {k: v for k, v in data.items() if k in _PRESET_FIELDS}
+        if 'dialog' in kwargs:
+            kwargs['dialog'] = tuple(kwargs['dialog'] or ())
+        return cls(**kwargs)
+
+
+_PRESET_FIELDS = frozenset(f.name for f in fields(NPCPreset) if f.init)
+
 NPC_PRESETS = {
-    'sensei': {
-        'name': 'Sensei',
-        'name_jp': '先生',
-        'skin_color': color.rgb(240, 210, 175),
-        'hair_color': color.rgb(230, 230, 235),       # White/silver hair
-        'hair_style': 'long',
-        'eye_color': color.rgb(60, 50, 40),
-        'outfit_color': color.rgb(60, 60, 90),         # Traditional dark blue
-        'outfit_accent': color.rgb(180, 160, 120),     # Gold sash
-        'indicator': '!',
-        'indicator_color': color.yellow,
-        'dialog': [
+    'sensei': NPCPreset(
+        name='Sensei',
+        name_jp='先生',
+        skin_color=color.rgb(240, 210, 175),
+        hair_color=color.rgb(230, 230, 235),        # White/silver hair
+        hair_style='long',
+        eye_color=color.rgb(60, 50, 40),
+        outfit_color=color.rgb(60, 60, 90),         # Traditional dark blue
+        outfit_accent=color.rgb(180, 160, 120),     # Gold sash
+        indicator='!',
+        indicator_color=color.yellow,
+        dialog=(
             'Welcome to Nihongo Quest, young learner!',
             'I am Sensei. I will guide you on your journey.',
             'Each monument represents a stage of mastery.',
             'Begin at the Hiragana Temple and work your way forward.',
             'Ganbatte kudasai! — Do your best!',
-        ],
-    },
-    'sakura': {
-        'name': 'Sakura',
-        'name_jp': 'さくら',
-        'skin_color': color.rgb(255, 225, 200),
-        'hair_color': color.rgb(230, 140, 170),        # Pink hair
-        'hair_style': 'ponytail',
-        'eye_color': color.rgb(100, 60, 120),
-        'outfit_color': color.rgb(240, 160, 180),      # Pink outfit
-        'outfit_accent': color.rgb(255, 255, 255),     # White accent
-        'indicator': '?',
-        'indicator_color': color.rgb(255, 180, 200),
-        'dialog': [
+        ),
+    ),
+    'sakura': NPCPreset(
+        name='Sakura',
+        name_jp='さくら',
+        skin_color=color.rgb(255, 225, 200),
+        hair_color=color.rgb(230, 140, 170),        # Pink hair
+        hair_style='ponytail',
+        eye_color=color.rgb(100, 60, 120),
+        outfit_color=color.rgb(240, 160, 180),      # Pink outfit
+        outfit_accent=color.rgb(255, 255, 255),     # White accent
+        indicator='?',
+        indicator_color=color.rgb(255, 180, 200),
+        dialog=(
             'Hi there! I\'m Sakura!',
             'Need help? I know lots of tips and tricks.',
             'Did you know? Practicing every day is the best strategy!',
             'Ganbare! — You can do it!',
-        ],
-    },
+        ),
+    ),
 }
 
 
-class NPC(Entity):
+@dataclass(slots=True)
+class NPCState:
+    """Per-NPC idle animation state, read every step by the animation system."""
+    anim_time: float = 0.0
+    bob_speed: float = 2.5
+    bob_height: float = 0.02
+    indicator_bob_speed: float = 3.0
+
+
+class _NPCAnimationSystem:
     """
-    Non-player character entity for tutorials and guidance.
-    Built from the same primitive style as PlayerCharacter but with
-    distinct colors, a floating name tag, and speech bubble indicator.
+    Steps the idle animation of every live NPC from a single update hook.
+
+    NPCs register on construction; one driver entity ticks them all at
+    ``NPC._UPDATE_INTERVAL`` instead of Ursina calling ``update()`` on each
+    NPC every frame.
     """
 
-    def __init__(self, preset=None, npc_data=None, position=(0, 0, 0),
-                 on_click_callback=None, **kwargs):
-        super().__init__(position=position, **kwargs)
+    def __init__(self):
+        self._npcs = []
+        self._accum = 0.0
+        self._driver = None
 
-        # Load from preset or custom data
-        if preset and preset in NPC_PRESETS:
-            data = NPC_PRESETS[preset].copy()
-        elif npc_data:
-            data = npc_data.copy()
-        else:
-            data = NPC_PRESETS['sensei'].copy()
+    def register(self, npc):
+        """Start animating ``npc``."""
+        if self._driver is None:
+            self._driver = Entity(name='npc_animation_system', update=self.tick)
+        self._npcs.append(npc)
 
-        self._data = data
-        self._npc_name = data.get('name', 'NPC')
-        self._npc_name_jp = data.get('name_jp', '')
-        self._dialog_lines = data.get('dialog', [])
-        self._on_click_callback = on_click_callback
+    def tick(self):
+        """Advance every enabled NPC by the time gathered since the last step."""
+        self._accum += time.dt
+        if self._accum < NPC._UPDATE_INTERVAL:
+            return
+        step = self._accum
+        self._accum = 0.0
 
-        # Visual parts
-        self._parts = {}
-        self._name_tag = None
-        self._indicator = None
-        self._indicator_text = None
+        sin = math.sin
+        for npc in self._npcs:
+            if not npc.enabled:
+                continue
+            npc._update_overlay_lod()
+            st = npc._s
+            t = st.anim_time + step
+            st.anim_time = t
 
-        # Animation state
-        self._anim_time = 0.0
-        self._bob_speed = 2.5
-        self._bob_height = 0.02
-        self._indicator_bob_speed = 3.0
+            # Body bob
+            bob = sin(t * st.bob_speed) * st.bob_height
+            npc._body.y = 0.7 + bob
+            npc._head.y = 1.35 + bob
 
-        # Build
-        self._build_body()
-        self._build_name_tag()
-        self._build_indicator()
-        self._build_collider()
+            # Indicator float
+            if npc._overlays_visible:
+                npc._indicator.y = 2.5 + sin(t * st.indicator_bob_speed) * 0.08
 
-    # ─────────────────────────────────────────────
-    # Body construction (same structure as player)
-    # ─────────────────────────────────────────────
 
-    def _build_body(self):
-        """Construct the NPC body from primitives."""
-        data = self._data
-        skin = data.get('skin_color', color.rgb(240, 210, 175))
-        hair_col = data.get('hair_color', color.rgb(230, 230, 235))
-        hair_style = data.get('hair_style', 'short')
-        eye_col = data.get('eye_color', color.rgb(60, 50, 40))
-        outfit_col = data.get('outfit_color', color.rgb(60, 60, 90))
-        accent_col = data.get('outfit_accent', color.rgb(180, 160, 120))
-
-        # Body (torso)
-        self._parts['body'] = Entity(
-            parent=self,
-            model='cube',
-            color=outfit_col,
-            scale=(0.6, 0.7, 0.35),
-            position=(0, 0.7, 0),
-        )
+_NPC_SYSTEM = _NPCAnimationSystem()
 
-        # Belt / sash
-        self._parts['belt'] = Entity(
-            parent=self,
-            model='cube',
-            color=accent_col,
-            scale=(0.62, 0.1, 0.36),
-            position=(0, 0.45, 0),
-        )
+# Camera distance within which an NPC's name tag and indicator are built /
+# shown; beyond it only the body is drawn.
+OVERLAY_LOD_DISTANCE = 80
 
-        # Head
-        self._parts['head'] = Entity(
-            parent=self,
-            model='sphere',
-            color=skin,
-            scale=(0.45, 0.45, 0.45),
-            position=(0, 1.35, 0),
-        )
 
-        # Eyes
-        self._parts['eye_white_left'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=color.white,
-            scale=(0.2, 0.2, 0.06),
-            position=(-0.2, 0.05, 0.42),
-        )
-        self._parts['eye_white_right'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=color.white,
-            scale=(0.2, 0.2, 0.06),
-            position=(0.2, 0.05, 0.42),
-        )
-        self._parts['eye_left'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=eye_col,
-            scale=(0.15, 0.15, 0.08),
-            position=(-0.2, 0.05, 0.45),
-        )
-        self._parts['eye_right'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=eye_col,
-            scale=(0.15, 0.15, 0.08),
-            position=(0.2, 0.05, 0.45),
-        )
+# ─────────────────────────────────────────────────────────────
+# Shared body prefabs
+# ─────────────────────────────────────────────────────────────
+# Flattened head / limb geometry per distinct look, built once and copied
+# into every NPC that shares it (the copies share the same vertex data).
+_BODY_PREFABS = {}
 
-        # Hair
-        self._build_hair(hair_col, hair_style)
+def _look_key(data):
+    """Hashable key for the parts of a preset that affect body geometry."""
+    return (data.hair_style, tuple(data.skin_color), tuple(data.hair_color),
+            tuple(data.eye_color), tuple(data.outfit_color), tuple(data.outfit_accent))
 
-        # Arms
-        self._parts['arm_left'] = Entity(
-            parent=self,
-            model='cube',
-            color=outfit_col,
-            scale=(0.18, 0.55, 0.18),
-            position=(-0.4, 0.72, 0),
-            origin_y=0.5,
-        )
-        self._parts['hand_left'] = Entity(
-            parent=self._parts['arm_left'],
-            model='sphere',
-            color=skin,
-            scale=(0.6, 0.3, 0.6),
-            position=(0, -0.55, 0),
-        )
-        self._parts['arm_right'] = Entity(
-            parent=self,
+
+def _body_prefabs(data):
+    """
+    Return the ``(head, limbs)`` prefab nodes for an NPC look.
+
+    Built on first use (models need a running Ursina app) under detached
+    NodePaths, so the prefabs themselves are never rendered — only copies.
+    """
+    key = _look_key(data)
+    prefabs = _BODY_PREFABS.get(key)
+    if prefabs is None:
+        head = NodePath('npc_head_prefab')
+        _build_head(head, data)
+        head.flatten_strong()
+        limbs = NodePath('npc_limbs_prefab')
+        _build_limbs(limbs, data)
+        limbs.flatten_strong()
+        prefabs = _BODY_PREFABS[key] = (head, limbs)
+    return prefabs
+
+
+def _build_head(root, data):
+    """Head sphere, eyes and hair, centred on the head."""
+    skin = data.skin_color
+    eye_col = data.eye_color
+
+    head = Entity(
+        parent=root,
+        model='sphere',
+        color=skin,
+        scale=(0.45, 0.45, 0.45),
+        add_to_scene_entities=False,
+    )
+
+    # Eyes
+    Entity(
+        parent=head,
+        model='sphere',
+        color=color.white,
+        scale=(0.2, 0.2, 0.06),
+        position=(-0.2, 0.05, 0.42),
+        add_to_scene_entities=False,
+    )
+    Entity(
+        parent=head,
+        model='sphere',
+        color=color.white,
+        scale=(0.2, 0.2, 0.06),
+        position=(0.2, 0.05, 0.42),
+        add_to_scene_entities=False,
+    )
+    Entity(
+        parent=head,
+        model='sphere',
+        color=eye_col,
+        scale=(0.15, 0.15, 0.08),
+        position=(-0.2, 0.05, 0.45),
+        add_to_scene_entities=False,
+    )
+    Entity(
+        parent=head,
+        model='sphere',
+        color=eye_col,
+        scale=(0.15, 0.15, 0.08),
+        position=(0.2, 0.05, 0.45),
+        add_to_scene_entities=False,
+    )
+
+    # Hair
+    build_hair(head, data.hair_color, data.hair_style, lean_spikes=False)
+
+
+def _build_limbs(root, data):
+    """Belt, arms + hands and legs + feet, in NPC-local coordinates."""
+    skin = data.skin_color
+    outfit_col = data.outfit_color
+
+    # Belt / sash
+    Entity(
+        parent=root,
+        model='cube',
+        color=data.outfit_accent,
+        scale=(0.62, 0.1, 0.36),
+        position=(0, 0.45, 0),
+        add_to_scene_entities=False,
+    )
+
+    # Arms
+    for side in (-1, 1):
+        arm = Entity(
+            parent=root,
             model='cube',
             color=outfit_col,
             scale=(0.18, 0.55, 0.18),
-            position=(0.4, 0.72, 0),
+            position=(side * 0.4, 0.72, 0),
             origin_y=0.5,
+            add_to_scene_entities=False,
         )
-        self._parts['hand_right'] = Entity(
-            parent=self._parts['arm_right'],
-            model='sphere',
-            color=skin,
-            scale=(0.6, 0.3, 0.6),
-            position=(0, -0.55, 0),
-        )
+        build_hand(arm, skin)
 
-        # Legs
-        self._parts['leg_left'] = Entity(
-            parent=self,
-            model='cube',
-            color=color.rgb(40, 40, 55),
-            scale=(0.22, 0.5, 0.22),
-            position=(-0.15, 0.25, 0),
-            origin_y=0.5,
-        )
-        self._parts['foot_left'] = Entity(
-            parent=self._parts['leg_left'],
-            model='cube',
-            color=color.rgb(80, 50, 30),
-            scale=(0.8, 0.25, 1.2),
-            position=(0, -0.55, 0.05),
-        )
-        self._parts['leg_right'] = Entity(
-            parent=self,
+    # Legs
+    for side in (-1, 1):
+        leg = Entity(
+            parent=root,
             model='cube',
-            color=color.rgb(40, 40, 55),
+            color=_DEFAULT_LEG_COLOR,
             scale=(0.22, 0.5, 0.22),
-            position=(0.15, 0.25, 0),
+            position=(side * 0.15, 0.25, 0),
             origin_y=0.5,
+            add_to_scene_entities=False,
         )
-        self._parts['foot_right'] = Entity(
-            parent=self._parts['leg_right'],
-            model='cube',
-            color=color.rgb(80, 50, 30),
-            scale=(0.8, 0.25, 1.2),
-            position=(0, -0.55, 0.05),
-        )
+        build_foot(leg)
 
-    def _build_hair(self, hair_col, hair_style):
-        """Build hair based on style."""
-        head = self._parts['head']
-
-        if hair_style == 'short':
-            self._parts['hair_top'] = Entity(
-                parent=head, model='sphere', color=hair_col,
-                scale=(1.08, 0.6, 1.05), position=(0, 0.3, -0.05),
-            )
-        elif hair_style == 'long':
-            self._parts['hair_top'] = Entity(
-                parent=head, model='sphere', color=hair_col,
-                scale=(1.1, 0.6, 1.1), position=(0, 0.3, -0.05),
-            )
-            self._parts['hair_back'] = Entity(
-                parent=head, model='cube', color=hair_col,
-                scale=(0.85, 1.6, 0.4), position=(0, -0.3, -0.35),
-            )
-        elif hair_style == 'spiky':
-            self._parts['hair_top'] = Entity(
-                parent=head, model='sphere', color=hair_col,
-                scale=(1.15, 0.75, 1.1), position=(0, 0.35, -0.05),
-            )
-            for i, angle in enumerate(range(0, 360, 45)):
-                rad = math.radians(angle)
-                self._parts[f'hair_spike_{i}'] = Entity(
-                    parent=head, model='cube', color=hair_col,
-                    scale=(0.12, 0.3, 0.12),
-                    position=(math.sin(rad) * 0.35, 0.55, math.cos(rad) * 0.35),
-                )
-        elif hair_style == 'ponytail':
-            self._parts['hair_top'] = Entity(
-                parent=head, model='sphere', color=hair_col,
-                scale=(1.08, 0.55, 1.05), position=(0, 0.3, -0.05),
-            )
-            self._parts['hair_tie'] = Entity(
-                parent=head, model='sphere', color=color.rgb(200, 50, 50),
-                scale=(0.2, 0.2, 0.2), position=(0, 0.15, -0.5),
-            )
-            self._parts['hair_tail'] = Entity(
-                parent=head, model='cube', color=hair_col,
-                scale=(0.25, 1.0, 0.2), position=(0, -0.4, -0.5),
-            )
-        else:
-            self._parts['hair_top'] = Entity(
-                parent=head, model='sphere', color=hair_col,
-                scale=(1.05, 0.4, 1.02), position=(0, 0.35, -0.05),
-            )
 
-    # ─────────────────────────────────────────────
-    # Name tag and indicator
-    # ─────────────────────────────────────────────
-
-    def _build_name_tag(self):
-        """Floating name tag above head."""
-        display_name = f'{self._npc_name}  {self._npc_name_jp}' if self._npc_name_jp else self._npc_name
-        self._name_tag = Text(
+# ─────────────────────────────────────────────────────────────
+# Floating text prefabs (name tag + speech bubble indicator)
+# ─────────────────────────────────────────────────────────────
+# Text layout happens once per distinct string; every NPC copies the frozen
+# geometry into its own billboard holder.
+_TEXT_PREFABS = {}
+_BUBBLE_COLOR = color.rgb(255, 255, 240)
+
+
+def _freeze_text(text):
+    """Swap a Text's live TextNodes for their generated static geometry."""
+    for tnp in text.text_nodes:
+        static = tnp.get_parent().attach_new_node(tnp.node().generate())
+        static.set_transform(tnp.get_transform())
+        tnp.remove_node()
+
+
+def _name_tag_prefab(display_name):
+    """Return the flattened name-tag prefab for ``display_name``."""
+    key = ('name', display_name)
+    prefab = _TEXT_PREFABS.get(key)
+    if prefab is None:
+        prefab = NodePath('npc_name_tag_prefab')
+        _freeze_text(Text(
             text=display_name,
-            parent=self,
-            position=(0, 2.0, 0),
+            parent=prefab,
             scale=(7, 7),
             color=color.white,
             origin=(0, 0),
-            billboard=True,
             background=True,
             background_color=color.rgba(0, 0, 0, 140),
-        )
+            add_to_scene_entities=False,
+        ))
+        prefab.flatten_strong()
+        _TEXT_PREFABS[key] = prefab
+    return prefab
 
-    def _build_indicator(self):
-        """Speech bubble indicator (! or ?) above head."""
-        indicator_char = self._data.get('indicator', '!')
-        indicator_col = self._data.get('indicator_color', color.yellow)
 
-        # Indicator bubble background
-        self._indicator = Entity(
-            parent=self,
-            position=(0, 2.5, 0),
-        )
+def _indicator_prefab(char, col):
+    """Return the flattened speech-bubble prefab showing ``char`` in ``col``."""
+    key = ('indicator', char, tuple(col))
+    prefab = _TEXT_PREFABS.get(key)
+    if prefab is None:
+        prefab = NodePath('npc_indicator_prefab')
 
         # Bubble background
         Entity(
-            parent=self._indicator,
+            parent=prefab,
             model='sphere',
-            color=color.rgb(255, 255, 240),
+            color=_BUBBLE_COLOR,
             scale=(0.45, 0.45, 0.15),
-            billboard=True,
+            add_to_scene_entities=False,
         )
 
         # Indicator character
-        self._indicator_text = Text(
-            text=indicator_char,
-            parent=self._indicator,
+        _freeze_text(Text(
+            text=char,
+            parent=prefab,
             position=(0, 0.0, 0.1),
             scale=(12, 12),
-            color=indicator_col,
+            color=col,
             origin=(0, 0),
-            billboard=True,
-        )
+            add_to_scene_entities=False,
+        ))
 
         # Small triangle "tail" pointing down
         Entity(
-            parent=self._indicator,
+            parent=prefab,
             model='cube',
-            color=color.rgb(255, 255, 240),
+            color=_BUBBLE_COLOR,
             scale=(0.1, 0.15, 0.1),
             position=(0, -0.25, 0),
             rotation=(0, 0, 45),
-            billboard=True,
+            add_to_scene_entities=False,
         )
 
-    def _build_collider(self):
-        """Clickable collider for the whole NPC."""
-        self._collider_entity = Entity(
-            parent=self,
+        prefab.flatten_strong()
+        _TEXT_PREFABS[key] = prefab
+    return prefab
+
+
+class NPC(Entity):
+    """
+    Non-player character entity for tutorials and guidance.
+    Built from the same primitive style as PlayerCharacter but with
+    distinct colors, a floating name tag, and speech bubble indicator.
+    """
+
+    # Idle animation runs at a fixed 30 Hz regardless of frame rate
+    _UPDATE_INTERVAL = 1.0 / 30.0
+
+    def __init__(self, preset=None, npc_data=None, position=(0, 0, 0),
+                 on_click_callback=None, **kwargs):
+        super().__init__(position=position, **kwargs)
+
+        # Load from preset or custom data — presets are shared, never copied
+        if preset and preset in NPC_PRESETS:
+            data = NPC_PRESETS[preset]
+        elif npc_data:
+            data = npc_data if isinstance(npc_data, NPCPreset) else NPCPreset.from_dict(npc_data)
+        else:
+            data = NPC_PRESETS['sensei']
+
+        self._data = data
+        self._npc_name = data.name
+        self._npc_name_jp = data.name_jp
+        self._dialog_lines = data.dialog
+        self._on_click_callback = on_click_callback
+
+        # Body parts live under a RigidBodyCombiner: the whole figure renders
+        # as one combined mesh, while body / head stay individually movable
+        # for the idle bob (the combiner re-applies rigid child transforms).
+        self._rbc = RigidBodyCombiner(f'npc_{self._npc_name}')
+        self._rbc_np = NodePath(self._rbc)
+        self._rbc_np.reparent_to(self)
+
+        # Visual parts — body / head are bobbed every step, the rest never move
+        self._body = None
+        self._head = None
+        self._name_tag = None           # name tag + indicator are built lazily,
+        self._indicator = None          # the first time the camera comes near
+        self._overlays_visible = False
+        self._indicator_char = data.indicator
+        self._indicator_color = data.indicator_color
+
+        # Animation state
+        self._s = NPCState()
+
+        # Build
+        self._build_body()
+        self._rbc.collect()
+        self._build_collider()
+        _NPC_SYSTEM.register(self)
+
+    # ─────────────────────────────────────────────
+    # Body construction (same structure as player)
+    # ─────────────────────────────────────────────
+
+    def _build_body(self):
+        """Assemble the NPC from the torso plus shared head / limb prefab copies."""
+        head_prefab, limbs_prefab = _body_prefabs(self._data)
+
+        # Body (torso) — moved by the idle bob
+        self._body = Entity(
             model='cube',
-            scale=(1.0, 2.2, 0.8),
-            position=(0, 1.0, 0),
-            color=color.clear,
-            collider='box',
+            parent=self._rbc_np,
+            color=self._data.outfit_color,
+            scale=(0.6, 0.7, 0.35),
+            position=(0, 0.7, 0),
         )
-        self._collider_entity.on_click = self._handle_click
+
+        # Head with eyes + hair — one holder, also moved by the idle bob
+        self._head = Entity(parent=self._rbc_np, position=(0, 1.35, 0))
+        head_prefab.copy_to(self._head)
+
+        # Belt, arms, hands, legs and feet never move on their own
+        limbs = Entity(parent=self._rbc_np)
+        limbs_prefab.copy_to(limbs)
 
     # ─────────────────────────────────────────────
-    # Animation
+    # Name tag and indicator
     # ─────────────────────────────────────────────
 
-    def update(self):
-        """Idle animation: subtle bobbing + indicator float."""
-        self._anim_time += time.dt
+    def _build_name_tag(self):
+        """Floating name tag above head (copy of the shared text prefab)."""
+        self._name_tag = Entity(parent=self, position=(0, 2.0, 0), billboard=True)
+        _name_tag_prefab(self._data.display_name).copy_to(self._name_tag)
 
-        # Body bob
-        bob = math.sin(self._anim_time * self._bob_speed) * self._bob_height
-        if 'body' in self._parts:
-            self._parts['body'].y = 0.7 + bob
-        if 'head' in self._parts:
-            self._parts['head'].y = 1.35 + bob
+    def _build_indicator(self):
+        """Speech bubble indicator (! or ?) above head."""
+        # One billboard holder; the bubble, character and tail are a shared prefab
+        self._indicator = Entity(parent=self, position=(0, 2.5, 0), billboard=True)
+        _indicator_prefab(self._indicator_char, self._indicator_color).copy_to(self._indicator)
+
+    def _update_overlay_lod(self):
+        """Build / show the name tag and indicator only while the camera is in range."""
+        near = distance(self.world_position, camera.world_position) < OVERLAY_LOD_DISTANCE
+        if near == self._overlays_visible:
+            return
+        if near and self._name_tag is None:
+            self._build_name_tag()
+            self._build_indicator()
+        if self._name_tag:
+            self._name_tag.enabled = near
+            self._indicator.enabled = near
+        self._overlays_visible = near
 
-        # Indicator float
-        if self._indicator:
-            indicator_bob = math.sin(self._anim_time * self._indicator_bob_speed) * 0.08
-            self._indicator.y = 2.5 + indicator_bob
+    def _build_collider(self):
+        """Clickable box collider on the NPC itself (no extra collider entity)."""
+        self.collider = BoxCollider(self, center=Vec3(0, 1.0, 0), size=Vec3(1.0, 2.2, 0.8))
+        self.on_click = self._handle_click
 
     # ─────────────────────────────────────────────
     # Interaction
@@ -378,7 +481,8 @@ class NPC(Entity):
         if self._on_click_callback:
             self._on_click_callback(self)
         else:
-            self.on_click()
+            # The instance's on_click is this dispatcher; call the class handler
+            type(self).on_click(self)
 
     def on_click(self):
         """Default click handler — can be overridden."""
@@ -400,10 +504,15 @@ class NPC(Entity):
 
     def set_indicator(self, char, col=None):
         """Change the indicator character and optionally its color."""
-        if self._indicator_text:
-            self._indicator_text.text = char
-            if col:
-                self._indicator_text.color = col
+        col = col or self._indicator_color
+        if char == self._indicator_char and col == self._indicator_color:
+            return
+        self._indicator_char = char
+        self._indicator_color = col
+        if not self._indicator:
+            return                      # not built yet; picked up by _build_indicator
+        self._indicator.get_children().detach()
+        _indicator_prefab(char, col).copy_to(self._indicator)
 
     # ─────────────────────────────────────────────
     # Visibility
@@ -416,17 +525,3 @@ class NPC(Entity):
     def hide(self):
         """Hide the NPC."""
         self.enabled = False
-
-    def destroy_npc(self):
-        """Clean up all entities."""
-        for part in self._parts.values():
-            if part is not None:
-                destroy(part)
-        self._parts.clear()
-        if self._name_tag:
-            destroy(self._name_tag)
-        if self._indicator:
-            destroy(self._indicator)
-        if hasattr(self, '_collider_entity') and self._collider_entity:
-            destroy(self._collider_entity)
-        destroy(self)
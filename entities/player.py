@@ -1,7 +1,139 @@
 from ursina import *
+from panda3d.core import NodePath, RigidBodyCombiner, TransparencyAttrib
+from dataclasses import dataclass
+from entities._body_parts import build_foot, build_hair, build_hand
+from PIL import Image, ImageDraw
 import math
 
 
+# ─────────────────────────────────────────────────────────────
+# Default / fixed part colors — built once, shared by every character
+# ─────────────────────────────────────────────────────────────
+_DEFAULT_SKIN = color.rgb(255, 220, 185)
+_DEFAULT_HAIR = color.rgb(40, 30, 20)
+_DEFAULT_EYE = color.rgb(60, 40, 20)
+_DEFAULT_OUTFIT = color.rgb(50, 80, 160)
+_DEFAULT_ACCENT = color.rgb(200, 50, 50)
+_LEG_COLOR = color.rgb(40, 40, 60)
+
+# Appearance colors are interned so equal colors share one object
+_COLOR_KEYS = ('skin_color', 'hair_color', 'eye_color', 'outfit_color', 'outfit_accent')
+_COLOR_CACHE = {}
+
+
+def _intern_color(c):
+    """Return the shared Color equal to ``c`` (``c`` itself the first time it is seen)."""
+    return _COLOR_CACHE.setdefault(tuple(c), c)
+
+
+def _interned_appearance(appearance_data):
+    """Copy of ``appearance_data`` with its colors interned."""
+    return {
+        key: _intern_color(value) if key in _COLOR_KEYS else value
+        for key, value in appearance_data.items()
+    }
+
+
+# ─────────────────────────────────────────────────────────────
+# Static detail prefabs
+# ─────────────────────────────────────────────────────────────
+# Eyes, hair, hands and feet only ever move with the part they sit on, and
+# the belt never moves at all, so each look is built once under a detached
+# NodePath, flattened to a single Geom, and copied onto the animated parts
+# (the belt onto the character root).
+_DETAIL_PREFABS = {}
+
+
+def _detail_prefab(key, build, *args):
+    """Return the flattened prefab for ``key``, made by ``build(root, *args)`` on first use."""
+    prefab = _DETAIL_PREFABS.get(key)
+    if prefab is None:
+        prefab = NodePath(f'player_{key[0]}_prefab')
+        build(prefab, *args)
+        prefab.flatten_strong()
+        _DETAIL_PREFABS[key] = prefab
+    return prefab
+
+
+def _build_belt(root, accent_col):
+    """Outfit accent belt, in character-local coordinates."""
+    Entity(parent=root, model='cube', color=accent_col,
+           scale=(0.62, 0.08, 0.36), position=(0, 0.45, 0),
+           add_to_scene_entities=False)
+
+
+# Each eye is a small textured quad (white oval + pupil) sized like the old
+# sphere eyes.  The head is a unit sphere, so a flat face-wide quad would cut
+# into it; instead each quad sits just proud of the surface and is turned to
+# the surface normal at the eye centre.
+_EYE_TEXTURE_SIZE = 16
+_EYE_DIAMETER = 0.2
+_PUPIL_DIAMETER = 0.15
+_EYE_X, _EYE_Y = 0.2, 0.05
+_EYE_SURFACE_Z = math.sqrt(0.25 - _EYE_X ** 2 - _EYE_Y ** 2)    # head radius 0.5
+_EYE_YAW = math.degrees(math.atan2(_EYE_X, _EYE_SURFACE_Z))
+_EYE_Z = _EYE_SURFACE_Z + 0.02
+_EYE_TEXTURES = {}
+
+
+def _eye_texture(eye_col):
+    """Texture with a white eye and an ``eye_col`` pupil (cached per color)."""
+    key = tuple(eye_col)
+    texture = _EYE_TEXTURES.get(key)
+    if texture is None:
+        size = _EYE_TEXTURE_SIZE
+        pupil = tuple(round(c * 255) for c in key[:3])
+
+        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        for diameter, fill in ((_EYE_DIAMETER, (255, 255, 255)), (_PUPIL_DIAMETER, pupil)):
+            r = size * diameter / _EYE_DIAMETER / 2
+            draw.ellipse((size / 2 - r, size / 2 - r, size / 2 + r - 1, size / 2 + r - 1), fill=fill)
+        texture = _EYE_TEXTURES[key] = Texture(image)
+    return texture
+
+
+def _build_eyes(root, eye_col):
+    """Both eye quads, in head-local coordinates."""
+    texture = _eye_texture(eye_col)
+    for side in (-1, 1):
+        eye = Entity(parent=root, model='quad', texture=texture,
+                     scale=_EYE_DIAMETER, position=(side * _EYE_X, _EYE_Y, _EYE_Z),
+                     # quads face -z; the face looks down +z, turned outward
+                     rotation=(0, 180 + side * _EYE_YAW, 0),
+                     add_to_scene_entities=False)
+        # Cut-out alpha: the ovals have hard edges, and binary transparency
+        # needs no back-to-front sorting once flattened into the prefab
+        eye.setTransparency(TransparencyAttrib.M_binary)
+
+
+# Fallback for any appearance key missing from the player's data
+_DEFAULT_APPEARANCE = {
+    'skin_color': _DEFAULT_SKIN,
+    'hair_color': _DEFAULT_HAIR,
+    'hair_style': 'short',
+    'eye_color': _DEFAULT_EYE,
+    'outfit_color': _DEFAULT_OUTFIT,
+    'outfit_accent': _DEFAULT_ACCENT,
+}
+
+
+@dataclass(slots=True)
+class PlayerState:
+    """Movement and animation state of the player, read every frame."""
+    target_pos: Vec3 | None = None
+    move_speed: float = 5
+    is_moving: bool = False
+    anim_time: float = 0.0
+    bob_speed: float = 3.0
+    bob_height: float = 0.03
+    walk_bob_speed: float = 8.0
+    walk_bob_height: float = 0.06
+    arm_swing_angle: float = 25.0
+    limbs_swung: bool = False         # arms / legs rotated away from rest
+    last_bob: float = 0.0             # bob offset currently applied to body / head
+
+
 class PlayerCharacter(Entity):
     """
     Player character entity for the Nihongo Quest overworld.
@@ -13,379 +145,286 @@ class PlayerCharacter(Entity):
         super().__init__(position=position, **kwargs)
 
         # Default appearance if none provided
-        self._appearance_data = appearance_data or {
-            'skin_color': color.rgb(255, 220, 185),
-            'hair_color': color.rgb(40, 30, 20),
-            'hair_style': 'short',
-            'eye_color': color.rgb(60, 40, 20),
-            'outfit_color': color.rgb(50, 80, 160),
-            'outfit_accent': color.rgb(200, 50, 50),
-        }
+        self._appearance_data = _interned_appearance(appearance_data or _DEFAULT_APPEARANCE)
 
-        # Movement state
-        self._target_pos = None
-        self._move_speed = 5
-        self._is_moving = False
+        # Movement + animation state (slotted; read every frame)
+        self._s = PlayerState()
 
-        # Animation state
-        self._anim_time = 0.0
-        self._bob_speed = 3.0
-        self._bob_height = 0.03
-        self._walk_bob_speed = 8.0
-        self._walk_bob_height = 0.06
-        self._arm_swing_angle = 25.0
+        # Body parts live under a RigidBodyCombiner: the character renders as
+        # one combined mesh, while body / head / arms / legs stay individually
+        # movable for the walk + idle animation.
+        self._rbc = RigidBodyCombiner('player_character')
+        self._rbc_np = NodePath(self._rbc)
+        self._rbc_np.reparent_to(self)
 
-        # Body part references
+        # Body part references (animated parts are also bound directly below)
         self._parts = {}
+        self._body = self._head = None
+        self._arm_l = self._arm_r = None
+        self._leg_l = self._leg_r = None
+        self._details = {}      # flattened static detail copies (belt, eyes, hair, hands, feet)
 
         # Build the character
         self._build_character()
+        self._rbc.collect()
 
     def _build_character(self):
         """Construct the 3D character from primitives."""
-        data = self._appearance_data
+        look = self._look
 
-        skin = data.get('skin_color', color.rgb(255, 220, 185))
-        hair_col = data.get('hair_color', color.rgb(40, 30, 20))
-        hair_style = data.get('hair_style', 'short')
-        eye_col = data.get('eye_color', color.rgb(60, 40, 20))
-        outfit_col = data.get('outfit_color', color.rgb(50, 80, 160))
-        accent_col = data.get('outfit_accent', color.rgb(200, 50, 50))
+        skin = look('skin_color')
+        hair_col = look('hair_color')
+        hair_style = look('hair_style')
+        eye_col = look('eye_color')
+        outfit_col = look('outfit_color')
+        accent_col = look('outfit_accent')
 
         # ── Body (torso) ── centered at y=0.7, size 0.6 wide x 0.7 tall x 0.35 deep
         self._parts['body'] = Entity(
-            parent=self,
             model='cube',
+            parent=self._rbc_np,
             color=outfit_col,
             scale=(0.6, 0.7, 0.35),
             position=(0, 0.7, 0),
         )
 
-        # Outfit accent belt
-        self._parts['belt'] = Entity(
-            parent=self,
-            model='cube',
-            color=accent_col,
-            scale=(0.62, 0.08, 0.36),
-            position=(0, 0.45, 0),
-        )
-
         # ── Head ── sphere on top of body
         self._parts['head'] = Entity(
-            parent=self,
             model='sphere',
+            parent=self._rbc_np,
             color=skin,
             scale=(0.45, 0.45, 0.45),
             position=(0, 1.35, 0),
         )
 
-        # ── Eyes ── two small spheres on face
-        self._parts['eye_left'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=eye_col,
-            scale=(0.15, 0.15, 0.08),
-            position=(-0.2, 0.05, 0.45),
-        )
-        self._parts['eye_right'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=eye_col,
-            scale=(0.15, 0.15, 0.08),
-            position=(0.2, 0.05, 0.45),
-        )
-
-        # Eye whites (slightly behind pupils)
-        self._parts['eye_white_left'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=color.white,
-            scale=(0.2, 0.2, 0.06),
-            position=(-0.2, 0.05, 0.42),
-        )
-        self._parts['eye_white_right'] = Entity(
-            parent=self._parts['head'],
-            model='sphere',
-            color=color.white,
-            scale=(0.2, 0.2, 0.06),
-            position=(0.2, 0.05, 0.42),
-        )
-
         # ── Hair ── varies by style
         self._build_hair(hair_col, hair_style)
 
         # ── Arms ── two cubes hanging from shoulders
         self._parts['arm_left'] = Entity(
-            parent=self,
             model='cube',
+            parent=self._rbc_np,
             color=outfit_col,
             scale=(0.18, 0.55, 0.18),
             position=(-0.4, 0.72, 0),
-            origin_y=0.5,
-        )
-        # Hand
-        self._parts['hand_left'] = Entity(
-            parent=self._parts['arm_left'],
-            model='sphere',
-            color=skin,
-            scale=(0.6, 0.3, 0.6),
-            position=(0, -0.55, 0),
+            origin=(0, 0.5, 0),
         )
-
         self._parts['arm_right'] = Entity(
-            parent=self,
             model='cube',
+            parent=self._rbc_np,
             color=outfit_col,
             scale=(0.18, 0.55, 0.18),
             position=(0.4, 0.72, 0),
-            origin_y=0.5,
-        )
-        self._parts['hand_right'] = Entity(
-            parent=self._parts['arm_right'],
-            model='sphere',
-            color=skin,
-            scale=(0.6, 0.3, 0.6),
-            position=(0, -0.55, 0),
+            origin=(0, 0.5, 0),
         )
 
         # ── Legs ── two cubes below body
         self._parts['leg_left'] = Entity(
-            parent=self,
             model='cube',
-            color=color.rgb(40, 40, 60),
+            parent=self._rbc_np,
+            color=_LEG_COLOR,
             scale=(0.22, 0.5, 0.22),
             position=(-0.15, 0.25, 0),
-            origin_y=0.5,
+            origin=(0, 0.5, 0),
         )
-        # Foot
-        self._parts['foot_left'] = Entity(
-            parent=self._parts['leg_left'],
-            model='cube',
-            color=color.rgb(80, 50, 30),
-            scale=(0.8, 0.25, 1.2),
-            position=(0, -0.55, 0.05),
-        )
-
         self._parts['leg_right'] = Entity(
-            parent=self,
             model='cube',
-            color=color.rgb(40, 40, 60),
+            parent=self._rbc_np,
+            color=_LEG_COLOR,
             scale=(0.22, 0.5, 0.22),
             position=(0.15, 0.25, 0),
-            origin_y=0.5,
-        )
-        self._parts['foot_right'] = Entity(
-            parent=self._parts['leg_right'],
-            model='cube',
-            color=color.rgb(80, 50, 30),
-            scale=(0.8, 0.25, 1.2),
-            position=(0, -0.55, 0.05),
+            origin=(0, 0.5, 0),
         )
 
+        self._bind_animated_parts()
+
+        # ── Static details ── eyes, hands and feet never move relative to
+        # their part, nor the belt relative to the character, so each is a
+        # flattened prefab copy instead of entities
+        self._attach_belt(accent_col)
+        self._attach_eyes(eye_col)
+        self._attach_hands(skin)
+        foot = _detail_prefab(('foot',), build_foot)
+        self._attach_detail('foot_left', foot, self._leg_l)
+        self._attach_detail('foot_right', foot, self._leg_r)
+
+    def _look(self, key):
+        """Appearance value for ``key``, falling back to the default look."""
+        return self._appearance_data.get(key, _DEFAULT_APPEARANCE[key])
+
+    def _attach_detail(self, name, prefab, part):
+        """Copy a static detail prefab under ``part`` as ``name``, replacing any previous copy."""
+        old = self._details.pop(name, None)
+        if old is not None:
+            old.remove_node()
+        self._details[name] = prefab.copy_to(part)
+
+    def _attach_belt(self, accent_col):
+        """Attach the ``accent_col`` belt to the character root (it does not bob)."""
+        prefab = _detail_prefab(('belt', tuple(accent_col)), _build_belt, accent_col)
+        self._attach_detail('belt', prefab, self._rbc_np)
+
+    def _attach_eyes(self, eye_col):
+        """Attach the ``eye_col`` eye quads to the head."""
+        prefab = _detail_prefab(('eyes', tuple(eye_col)), _build_eyes, eye_col)
+        self._attach_detail('eyes', prefab, self._head)
+
+    def _attach_hands(self, skin):
+        """Attach ``skin``-coloured hands to both arms."""
+        hand = _detail_prefab(('hand', tuple(skin)), build_hand, skin)
+        self._attach_detail('hand_left', hand, self._arm_l)
+        self._attach_detail('hand_right', hand, self._arm_r)
+
+    def _bind_animated_parts(self):
+        """Cache the parts touched every frame by the animations."""
+        parts = self._parts
+        self._body = parts['body']
+        self._head = parts['head']
+        self._arm_l = parts['arm_left']
+        self._arm_r = parts['arm_right']
+        self._leg_l = parts['leg_left']
+        self._leg_r = parts['leg_right']
+
     def _build_hair(self, hair_col, hair_style):
-        """Build hair geometry based on style."""
-        # Remove old hair if it exists
-        for key in list(self._parts.keys()):
-            if key.startswith('hair'):
-                destroy(self._parts[key])
-                del self._parts[key]
-
-        head = self._parts['head']
-
-        if hair_style == 'short':
-            self._parts['hair_top'] = Entity(
-                parent=head,
-                model='sphere',
-                color=hair_col,
-                scale=(1.08, 0.6, 1.05),
-                position=(0, 0.3, -0.05),
-            )
-        elif hair_style == 'long':
-            self._parts['hair_top'] = Entity(
-                parent=head,
-                model='sphere',
-                color=hair_col,
-                scale=(1.1, 0.6, 1.1),
-                position=(0, 0.3, -0.05),
-            )
-            self._parts['hair_back'] = Entity(
-                parent=head,
-                model='cube',
-                color=hair_col,
-                scale=(0.85, 1.6, 0.4),
-                position=(0, -0.3, -0.35),
-            )
-        elif hair_style == 'spiky':
-            self._parts['hair_top'] = Entity(
-                parent=head,
-                model='sphere',
-                color=hair_col,
-                scale=(1.15, 0.75, 1.1),
-                position=(0, 0.35, -0.05),
-            )
-            # Spikes
-            for i, angle in enumerate(range(0, 360, 45)):
-                rad = math.radians(angle)
-                self._parts[f'hair_spike_{i}'] = Entity(
-                    parent=head,
-                    model='cube',
-                    color=hair_col,
-                    scale=(0.12, 0.3, 0.12),
-                    position=(
-                        math.sin(rad) * 0.35,
-                        0.55,
-                        math.cos(rad) * 0.35,
-                    ),
-                    rotation=(0, 0, -math.degrees(math.atan2(math.sin(rad), 1)) * 0.5),
-                )
-        elif hair_style == 'ponytail':
-            self._parts['hair_top'] = Entity(
-                parent=head,
-                model='sphere',
-                color=hair_col,
-                scale=(1.08, 0.55, 1.05),
-                position=(0, 0.3, -0.05),
-            )
-            self._parts['hair_tie'] = Entity(
-                parent=head,
-                model='sphere',
-                color=color.rgb(200, 50, 50),
-                scale=(0.2, 0.2, 0.2),
-                position=(0, 0.15, -0.5),
-            )
-            self._parts['hair_tail'] = Entity(
-                parent=head,
-                model='cube',
-                color=hair_col,
-                scale=(0.25, 1.0, 0.2),
-                position=(0, -0.4, -0.5),
-            )
-        else:
-            # Default / bald-ish
-            self._parts['hair_top'] = Entity(
-                parent=head,
-                model='sphere',
-                color=hair_col,
-                scale=(1.05, 0.4, 1.02),
-                position=(0, 0.35, -0.05),
-            )
+        """Attach the flattened hair prefab for ``hair_style`` to the head."""
+        prefab = _detail_prefab(('hair', tuple(hair_col), hair_style), build_hair, hair_col, hair_style)
+        self._attach_detail('hair', prefab, self._parts['head'])    # replaces old hair
 
     def move_to(self, target_pos, speed=5):
         """Begin smooth movement toward a target position."""
+        st = self._s
         if isinstance(target_pos, (list, tuple)):
-            self._target_pos = Vec3(*target_pos)
+            st.target_pos = Vec3(*target_pos)
         else:
-            self._target_pos = Vec3(target_pos)
-        self._move_speed = speed
-        self._is_moving = True
+            st.target_pos = Vec3(target_pos)
+        st.move_speed = speed
+        st.is_moving = True
 
         # Face the target direction
-        direction = self._target_pos - self.position
+        direction = st.target_pos - self.position
         if direction.length() > 0.01:
             angle = math.degrees(math.atan2(direction.x, direction.z))
             self.rotation_y = angle
 
     def update(self):
         """Handle movement animation and idle/walk animation each frame."""
-        self._anim_time += time.dt
+        dt = time.dt
+        st = self._s
+        st.anim_time += dt
 
-        if self._is_moving and self._target_pos is not None:
-            self._do_movement()
+        if st.is_moving and st.target_pos is not None:
+            self._do_movement(dt)
             self.walk_animation()
         else:
             self.idle_animation()
 
-    def _do_movement(self):
+    def _do_movement(self, dt):
         """Smoothly move toward target using lerp."""
-        direction = self._target_pos - self.position
-        dist = direction.length()
+        # Scalar math — no temporary Vec3s per frame
+        st = self._s
+        pos = self.position
+        px, py, pz = pos.x, pos.y, pos.z
+        target = st.target_pos
+        dx, dy, dz = target.x - px, target.y - py, target.z - pz
+        dist = (dx * dx + dy * dy + dz * dz) ** 0.5
 
         if dist < 0.1:
-            self.position = self._target_pos
-            self._is_moving = False
-            self._target_pos = None
-            # Reset arm rotations after stopping
-            if 'arm_left' in self._parts:
-                self._parts['arm_left'].rotation_x = 0
-            if 'arm_right' in self._parts:
-                self._parts['arm_right'].rotation_x = 0
-            if 'leg_left' in self._parts:
-                self._parts['leg_left'].rotation_x = 0
-            if 'leg_right' in self._parts:
-                self._parts['leg_right'].rotation_x = 0
+            self.position = target
+            self.stop()
             return
 
-        move_amount = min(self._move_speed * time.dt, dist)
-        move_vec = direction.normalized() * move_amount
-        self.position += move_vec
+        step = min(st.move_speed * dt, dist) / dist
+        self.x = px + dx * step
+        if dy:
+            self.y = py + dy * step
+        self.z = pz + dz * step
+
+    def stop(self):
+        """Cancel any move in progress and put the limbs back at rest."""
+        st = self._s
+        st.is_moving = False
+        st.target_pos = None
+        # Reset arm rotations after stopping (skipped if the walk cycle
+        # never ran, e.g. stop() while already standing)
+        if st.limbs_swung:
+            self._arm_l.rotation_x = 0
+            self._arm_r.rotation_x = 0
+            self._leg_l.rotation_x = 0
+            self._leg_r.rotation_x = 0
+            st.limbs_swung = False
 
     def idle_animation(self):
         """Subtle bobbing when standing still."""
-        bob = math.sin(self._anim_time * self._bob_speed) * self._bob_height
-        if 'body' in self._parts:
-            self._parts['body'].y = 0.7 + bob
-        if 'head' in self._parts:
-            self._parts['head'].y = 1.35 + bob
+        st = self._s
+        bob = math.sin(st.anim_time * st.bob_speed) * st.bob_height
+        self._apply_bob(st, bob)
+
+    def _apply_bob(self, st, bob):
+        """Move body + head to ``bob``, skipping writes that would not change them."""
+        if abs(bob - st.last_bob) > 1e-4:
+            self._body.y = 0.7 + bob
+            self._head.y = 1.35 + bob
+            st.last_bob = bob
 
     def walk_animation(self):
         """Bobbing + arm/leg swing while moving."""
-        t = self._anim_time * self._walk_bob_speed
-        bob = abs(math.sin(t)) * self._walk_bob_height
-
-        if 'body' in self._parts:
-            self._parts['body'].y = 0.7 + bob
-        if 'head' in self._parts:
-            self._parts['head'].y = 1.35 + bob
+        st = self._s
+        s = math.sin(st.anim_time * st.walk_bob_speed)     # drives the bob and both swings
+        bob = (s if s >= 0.0 else -s) * st.walk_bob_height
+        self._apply_bob(st, bob)
 
         # Arm swing
-        swing = math.sin(t) * self._arm_swing_angle
-        if 'arm_left' in self._parts:
-            self._parts['arm_left'].rotation_x = swing
-        if 'arm_right' in self._parts:
-            self._parts['arm_right'].rotation_x = -swing
+        swing = s * st.arm_swing_angle
+        self._arm_l.rotation_x = swing
+        self._arm_r.rotation_x = -swing
 
         # Leg swing (opposite to arms)
-        leg_swing = math.sin(t) * 20
-        if 'leg_left' in self._parts:
-            self._parts['leg_left'].rotation_x = -leg_swing
-        if 'leg_right' in self._parts:
-            self._parts['leg_right'].rotation_x = leg_swing
+        leg_swing = s * 20
+        self._leg_l.rotation_x = -leg_swing
+        self._leg_r.rotation_x = leg_swing
+        st.limbs_swung = True
 
     def set_appearance(self, appearance_data):
-        """Update all visual parts based on new appearance data."""
-        self._appearance_data = appearance_data
-
-        # Destroy all existing parts
-        for key in list(self._parts.keys()):
-            if self._parts[key] is not None:
-                destroy(self._parts[key])
-        self._parts.clear()
+        """Update the visual parts whose appearance values changed."""
+        old = self._appearance_data
+        appearance_data = self._appearance_data = _interned_appearance(
+            appearance_data or _DEFAULT_APPEARANCE)
+        changed = {
+            key for key in appearance_data.keys() | old.keys()
+            if appearance_data.get(key) != old.get(key)
+        }
+        if not changed:
+            return
 
-        # Rebuild
-        self._build_character()
+        # Colours are written in place; only the affected details are re-copied
+        look = self._look
+        if 'outfit_color' in changed:
+            outfit_col = look('outfit_color')
+            self._body.color = outfit_col
+            self._arm_l.color = outfit_col
+            self._arm_r.color = outfit_col
+        if 'outfit_accent' in changed:
+            self._attach_belt(look('outfit_accent'))
+        if 'skin_color' in changed:
+            skin = look('skin_color')
+            self._head.color = skin
+            self._attach_hands(skin)
+        if 'eye_color' in changed:
+            self._attach_eyes(look('eye_color'))
+        if 'hair_color' in changed or 'hair_style' in changed:
+            self._build_hair(look('hair_color'), look('hair_style'))
+
+        # Recombine so the merged mesh picks up the changes
+        self._rbc.collect()
 
     def show(self):
         """Make the character visible."""
-        self.enabled = True
-        for part in self._parts.values():
-            if part is not None:
-                part.enabled = True
+        self.enabled = True     # every part hangs off the combiner under self
 
     def hide(self):
         """Make the character invisible."""
         self.enabled = False
-        for part in self._parts.values():
-            if part is not None:
-                part.enabled = False
 
     @property
     def is_moving(self):
-        return self._is_moving
-
-    def destroy_character(self):
-        """Clean up all child entities."""
-        for key in list(self._parts.keys()):
-            if self._parts[key] is not None:
-                destroy(self._parts[key])
-        self._parts.clear()
-        destroy(self)
+        return self._s.is_moving
@@ -12,8 +12,11 @@ Usage:
 
 import sys
 import os
+import atexit
 import logging
-import time
+import logging.handlers
+import queue
+from time import monotonic as _monotonic, strftime as _strftime  # `time` is rebound by ursina
 
 # ---------------------------------------------------------------------------
 # Ensure the project root is on sys.path so imports like
@@ -35,24 +38,61 @@ from config import (
     SAVE_BASE_DIR, LOG_DIR, MAX_SAVE_SLOTS, MONUMENTS,
 )
 from core.save_system import (
-    save_game, load_game, delete_save, get_all_saves,
+    save_game_async, load_game, delete_save, get_all_saves,
     does_save_exist, create_new_save,
 )
 from core.game_manager import GameManager, GameState
 from core.progression import ProgressionTracker
+from content.hiragana import (
+    HIRAGANA_BASIC, HIRAGANA_DAKUTEN, HIRAGANA_HANDAKUTEN, HIRAGANA_COMBOS,
+)
+
+# Every hiragana character / combo a minigame can report as answered
+HIRAGANA_SET = frozenset(
+    entry["character"]
+    for table in (HIRAGANA_BASIC, HIRAGANA_DAKUTEN, HIRAGANA_HANDAKUTEN, HIRAGANA_COMBOS)
+    for entry in table.values()
+)
 
 # ---------------------------------------------------------------------------
 # Logging setup
 # ---------------------------------------------------------------------------
+class _CachedFormatter(logging.Formatter):
+    """Formatter that runs strftime once per wall-clock second, not per record."""
+
+    def __init__(self, fmt=None):
+        super().__init__(fmt)
+        self._last_second = None
+        self._last_stamp = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_stamp = _strftime(self.default_time_format, self.converter(second))
+        return self.default_msec_format % (self._last_stamp, record.msecs)
+
+
+# Records are only enqueued on the game thread; a listener thread formats
+# them and does the file / console writes.
 os.makedirs(LOG_DIR, exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, "nihongo_quest.log")),
-        logging.StreamHandler(sys.stdout),
-    ],
+_log_formatter = _CachedFormatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+_log_file_handler = logging.FileHandler(os.path.join(LOG_DIR, "nihongo_quest.log"))
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+# No formatter on the QueueHandler: basicConfig would give it the default
+# "LEVEL:name:msg" format and the listener's handlers would format twice.
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_file_handler, _log_stream_handler,
 )
+log_listener.start()
+atexit.register(log_listener.stop)     # window close skips _on_quit
 logger = logging.getLogger("nihongo_quest")
 logger.info("=" * 60)
 logger.info(f"  Nihongo Quest {GAME_VERSION} starting")
@@ -94,6 +134,45 @@ except ImportError:
     HAS_OVERWORLD = False
     logger.warning("Overworld module not found — using placeholder")
 
+# Fallback overworld colors
+_MON_UNLOCK_BG = color.rgb(139, 0, 0)
+_MON_LOCK_BG = color.rgb(60, 60, 60)
+_MON_UNLOCK_FG = color.rgb(255, 215, 0)
+_MON_LOCK_FG = color.rgb(120, 120, 120)
+_FALLBACK_TITLE_COLOR = _MON_UNLOCK_FG
+_FALLBACK_SUBTITLE_COLOR = color.rgb(200, 200, 200)
+_FALLBACK_BACK_BG = color.rgb(80, 80, 80)
+
+# Monument fields used by the fallback overworld, resolved once:
+# (monument id, Japanese name, English name, previous monument's name)
+_MON_VIEW = tuple(
+    (mid, mdata['name_jp'], mdata['name'], MONUMENTS.get(mid - 1, {}).get('name', '???'))
+    for mid, mdata in MONUMENTS.items()
+)
+_UNLOCK_HINTS = {
+    mid: f"Complete {prev_name} to unlock" for mid, _, _, prev_name in _MON_VIEW
+}
+
+# Fallback overworld monument grid: (monument id, label, position) per
+# button, laid out once at import
+_FALLBACK_PER_ROW = 4
+_FALLBACK_START_X = -0.45
+_FALLBACK_START_Y = 0.2
+_FALLBACK_BTN_WIDTH = 0.22
+_FALLBACK_BTN_HEIGHT = 0.12
+_FALLBACK_PADDING = 0.02
+_FALLBACK_GRID = tuple(
+    (
+        mid,
+        f"{name_jp}\n{name}",
+        (
+            _FALLBACK_START_X + (mid % _FALLBACK_PER_ROW) * (_FALLBACK_BTN_WIDTH + _FALLBACK_PADDING),
+            _FALLBACK_START_Y - (mid // _FALLBACK_PER_ROW) * (_FALLBACK_BTN_HEIGHT + _FALLBACK_PADDING),
+        ),
+    )
+    for mid, name_jp, name, _ in _MON_VIEW
+)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  NihongoQuestApp — master controller
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -113,14 +192,22 @@ class NihongoQuestApp:
         self.current_slot = None
         self.progression = None
 
+        # ── Save-slot scan cache (see _saves) ─────────────────────────────
+        self._saves_cache = None
+        self._saves_cache_ts = 0.0
+        self._pending_save = None   # Future of the last background save
+        self._pending_refresh = False   # save select refresh queued via invoke
+
         # ── Background ────────────────────────────────────────────────────
         window.color = BG_DARK
 
         # ── Global transition overlay ─────────────────────────────────────
         self.transition = TransitionScreen(parent=camera.ui)
         self.transition.z = -10  # In front of everything
+        self.transition.visible = False     # only shown while fading
+        self._transition_id = 0
 
-        # ── Instantiate all screens (hidden by default) ───────────────────
+        # ── Screens: only the main menu is needed at boot ─────────────────
         self.main_menu = MainMenu(
             on_new_game=self._on_new_game,
             on_continue=self._on_continue,
@@ -129,24 +216,21 @@ class NihongoQuestApp:
             on_quit=self._on_quit,
         )
 
-        self.save_select = SaveSelectScreen(
-            on_load=self._on_load_slot,
-            on_new_game=self._on_new_game_slot,
-            on_delete=self._on_delete_slot,
-            on_back=self._on_back_to_menu,
-        )
+        self._menu_children = getattr(self.main_menu, '_children_entities', [])
 
-        self.character_creation = CharacterCreation()
-
-        self.settings_screen = SettingsScreen(
-            on_back=self._on_back_to_menu,
-        )
+        # Everything else is built on first use (see the _get_* helpers),
+        # registering its hide() in _hide_callbacks when it is created
+        self._hide_callbacks = []
+        self.save_select = None
+        self.character_creation = None
+        self.settings_screen = None
 
         self.lesson_select = None  # Created dynamically when entering a monument
-        self.hud = HUD()
-        self.dialog = DialogBox()
+        self.hud = None
+        self.dialog = None
 
         self.overworld = None  # Created when entering overworld
+        self._fallback_entities = None  # Fallback overworld UI, built on first use
 
         # ── Hide everything initially ─────────────────────────────────────
         self._hide_all_screens()
@@ -162,18 +246,105 @@ class NihongoQuestApp:
 
     def _hide_all_screens(self):
         """Hide every screen. Called before showing a new one."""
+        _set_frame_hook(None)
+        self._play_transition()
         self.main_menu.enabled = False
-        for child in getattr(self.main_menu, '_children_entities', []):
+        for child in self._menu_children:
             child.enabled = False
-        self.save_select.hide() if hasattr(self.save_select, 'hide') else None
-        self.character_creation.hide() if hasattr(self.character_creation, 'hide') else None
-        self.settings_screen.hide() if hasattr(self.settings_screen, 'hide') else None
-        self.hud.hide() if hasattr(self.hud, 'hide') else None
-        self.dialog.hide() if hasattr(self.dialog, 'hide') else None
-        if self.overworld and hasattr(self.overworld, 'hide'):
-            self.overworld.hide()
-        if self.lesson_select and hasattr(self.lesson_select, 'hide'):
-            self.lesson_select.hide()
+        for hide in self._hide_callbacks:
+            hide()
+        # Neither is made by a _get_* helper, so they never register in
+        # _hide_callbacks: the overworld is created lazily when first entered
+        # (and may be missing if its construction failed), lesson select is
+        # rebuilt per monument visit
+        for screen in (self.overworld, self.lesson_select):
+            if screen is not None:
+                hide = getattr(screen, 'hide', None)
+                if hide:
+                    hide()
+
+    def _play_transition(self, duration=0.15):
+        """Fade the shared overlay from black to clear over the screen swap."""
+        self._transition_id += 1
+        transition_id = self._transition_id
+        self.transition.visible = True
+        self.transition.fade_in(
+            duration=duration,
+            on_complete=lambda: self._end_transition(transition_id),
+        )
+
+    def _end_transition(self, transition_id):
+        """Hide the overlay again, unless a newer transition has started."""
+        if transition_id == self._transition_id:
+            self.transition.visible = False
+
+    def _saves(self):
+        """All save slots, re-scanned at most every 0.25 s (or after invalidation)."""
+        now = _monotonic()
+        if self._saves_cache is None or now - self._saves_cache_ts > 0.25:
+            self._wait_for_save()
+            self._saves_cache = get_all_saves()
+            self._saves_cache_ts = now
+        return self._saves_cache
+
+    def _invalidate_saves(self):
+        """Drop the cached slot scan after a save is written or deleted."""
+        self._saves_cache = None
+
+    def _save_current(self):
+        """Queue a write of the current save on the background save thread."""
+        if self.current_save_data and self.current_slot:
+            self._pending_save = save_game_async(self.current_slot, self.current_save_data)
+            self._invalidate_saves()
+
+    def _wait_for_save(self):
+        """Block until the last queued save is on disk (before reading slots back)."""
+        if self._pending_save is not None:
+            self._pending_save.result()
+            self._pending_save = None
+
+    def _register_screen(self, screen):
+        """Add a newly built screen to the ones _hide_all_screens hides."""
+        if hasattr(screen, 'hide'):
+            self._hide_callbacks.append(screen.hide)
+        return screen
+
+    def _get_save_select(self):
+        """The save select screen, created on first use."""
+        if self.save_select is None:
+            self.save_select = self._register_screen(SaveSelectScreen(
+                on_load=self._on_load_slot,
+                on_new_game=self._on_new_game_slot,
+                on_delete=self._on_delete_slot,
+                on_back=self._on_back_to_menu,
+            ))
+        return self.save_select
+
+    def _get_character_creation(self):
+        """The character creation screen, created on first use."""
+        if self.character_creation is None:
+            self.character_creation = self._register_screen(CharacterCreation())
+        return self.character_creation
+
+    def _get_settings_screen(self):
+        """The settings screen, created on first use."""
+        if self.settings_screen is None:
+            self.settings_screen = self._register_screen(SettingsScreen(
+                on_back=self._on_back_to_menu,
+            ))
+        return self.settings_screen
+
+    def _get_hud(self):
+        """The in-game HUD, created on first use."""
+        if self.hud is None:
+            self.hud = self._register_screen(HUD())
+        return self.hud
+
+    def _get_dialog(self):
+        """The dialog box, created on first use."""
+        if self.dialog is None:
+            self.dialog = self._register_screen(DialogBox())
+        return self.dialog
 
     def _show_main_menu(self):
         """Transition to the main menu."""
@@ -189,7 +360,7 @@ class NihongoQuestApp:
     def _on_new_game(self):
         """New Game clicked — find first empty slot, open character creation."""
         logger.info("New Game requested")
-        saves = get_all_saves()
+        saves = self._saves()
         # Find first empty slot
         slot = None
         for i in range(1, MAX_SAVE_SLOTS + 1):
@@ -205,20 +376,18 @@ class NihongoQuestApp:
     def _on_continue(self):
         """Continue clicked — load most recent save."""
         logger.info("Continue requested")
-        saves = get_all_saves()
-        # Find most recently played save
-        best_slot = None
-        best_time = ""
-        for slot_num, data in saves.items():
-            if data is not None:
-                lp = data.get("last_played", "") or ""
-                if lp > best_time:
-                    best_time = lp
-                    best_slot = slot_num
-        if best_slot is not None:
+        saves = self._saves()
+        # Find most recently played save (ISO timestamps sort as strings);
+        # saves never stamped with last_played don't count
+        candidates = [
+            (lp, slot_num) for slot_num, data in saves.items()
+            if data is not None and (lp := data.get("last_played") or "")
+        ]
+        if candidates:
+            _, best_slot = max(candidates, key=lambda c: c[0])
             self._load_and_enter_overworld(best_slot)
         else:
-            # No saves exist — start new game
+            # No played saves exist — start new game
             self._on_new_game()
 
     def _on_load_game(self):
@@ -226,53 +395,67 @@ class NihongoQuestApp:
         logger.info("Load Game requested")
         self._hide_all_screens()
         self.gm.transition_to(GameState.LOADING)
-        saves = get_all_saves()
+        saves = self._saves()
         save_list = [saves.get(i) for i in range(1, MAX_SAVE_SLOTS + 1)]
-        self.save_select.refresh_slots(save_list) if hasattr(self.save_select, 'refresh_slots') else None
-        self.save_select.show()
+        save_select = self._get_save_select()
+        save_select.refresh_slots(save_list) if hasattr(save_select, 'refresh_slots') else None
+        save_select.show()
 
     def _on_settings_from_menu(self):
         """Settings clicked from main menu."""
         logger.info("Settings requested from menu")
         self._hide_all_screens()
         self.gm.transition_to(GameState.SETTINGS)
-        self.settings_screen.show()
+        self._get_settings_screen().show()
 
     def _on_quit(self):
         """Quit clicked."""
         logger.info("Quit requested")
-        if self.current_save_data and self.current_slot:
-            save_game(self.current_slot, self.current_save_data)
+        # Goes through the save thread too, so it lands after any queued write
+        self._save_current()
+        self._wait_for_save()
         application.quit()
 
     # ═══════════════════════════════════════════════════════════════════════
     #  Save Select callbacks
     # ═══════════════════════════════════════════════════════════════════════
 
-    def _on_load_slot(self, slot_index, data=None):
-        """User selected an existing save to load.
-        slot_index is 0-based from SaveSelectScreen; convert to 1-based."""
+    @staticmethod
+    def _slot_from_index(slot_index, action):
+        """Convert SaveSelectScreen's 0-based index to a 1-based slot and log ``action``."""
         slot = slot_index + 1
-        logger.info(f"Loading save slot {slot}")
-        self._load_and_enter_overworld(slot)
+        logger.info(f"{action} save slot {slot}")
+        return slot
+
+    def _on_load_slot(self, slot_index, data=None):
+        """User selected an existing save to load."""
+        self._load_and_enter_overworld(self._slot_from_index(slot_index, "Loading"))
 
     def _on_new_game_slot(self, slot_index):
-        """User clicked an empty slot — create new game in that slot.
-        slot_index is 0-based from SaveSelectScreen; convert to 1-based."""
-        slot = slot_index + 1
-        logger.info(f"New game in slot {slot}")
-        self._start_character_creation(slot)
+        """User clicked an empty slot — create new game in that slot."""
+        self._start_character_creation(self._slot_from_index(slot_index, "New game in"))
 
     def _on_delete_slot(self, slot_index):
-        """User confirmed deletion of a save slot.
-        slot_index is 0-based from SaveSelectScreen; convert to 1-based."""
-        slot = slot_index + 1
-        logger.info(f"Deleting save slot {slot}")
-        delete_save(slot)
-        # Refresh the save select screen
-        saves = get_all_saves()
+        """User confirmed deletion of a save slot."""
+        delete_save(self._slot_from_index(slot_index, "Deleting"))
+        self._invalidate_saves()
+        # Refresh the save select screen (once, however many deletes this frame)
+        self._schedule_save_list_refresh()
+
+    def _schedule_save_list_refresh(self):
+        """Refresh the save select slots on the next frame, coalescing repeat requests."""
+        if self._pending_refresh:
+            return
+        self._pending_refresh = True
+        invoke(self._do_refresh_save_list, delay=0)
+
+    def _do_refresh_save_list(self):
+        """Rescan the slots and push them to the save select screen."""
+        self._pending_refresh = False
+        saves = self._saves()
         save_list = [saves.get(i) for i in range(1, MAX_SAVE_SLOTS + 1)]
-        self.save_select.refresh_slots(save_list) if hasattr(self.save_select, 'refresh_slots') else None
+        save_select = self._get_save_select()
+        save_select.refresh_slots(save_list) if hasattr(save_select, 'refresh_slots') else None
 
     def _on_back_to_menu(self):
         """Back button from any sub-screen — return to main menu."""
@@ -289,13 +472,15 @@ class NihongoQuestApp:
         self.current_slot = slot
 
         # Wire up the character creation's start button
-        self.character_creation.show(slot)
+        character_creation = self._get_character_creation()
+        character_creation.show(slot)
+        _set_frame_hook(getattr(character_creation, 'update', None))
 
         # Override the on_start callback to capture character data
-        original_start = getattr(self.character_creation, '_on_start_adventure', None)
+        original_start = getattr(character_creation, '_on_start_adventure', None)
 
         def _on_creation_complete():
-            char_data = self.character_creation.get_character_data()
+            char_data = character_creation.get_character_data()
             player_name = char_data.get('name', 'Player') or 'Player'
             appearance = {
                 'skin_tone': char_data.get('skin_tone', 0),
@@ -306,12 +491,13 @@ class NihongoQuestApp:
             }
             logger.info(f"Character created: {player_name} in slot {slot}")
 
-            # Create the save file
-            create_new_save(slot, player_name, appearance, 'normal')
-            self._load_and_enter_overworld(slot)
+            # Create the save file and enter with the data just written
+            data = create_new_save(slot, player_name, appearance, 'normal')
+            self._invalidate_saves()
+            self._enter_overworld_with_data(slot, data)
 
         # Attach our callback
-        self.character_creation.on_start = _on_creation_complete
+        character_creation.on_start = _on_creation_complete
 
         logger.info(f"Character creation started for slot {slot}")
 
@@ -321,15 +507,21 @@ class NihongoQuestApp:
 
     def _load_and_enter_overworld(self, slot):
         """Load a save file and enter the overworld."""
-        self._hide_all_screens()
-
-        # Load save data
-        self.current_save_data = load_game(slot)
-        if self.current_save_data is None:
+        # Load save data (after any background write of it has landed)
+        self._wait_for_save()
+        data = load_game(slot)
+        if data is None:
             logger.error(f"Failed to load save slot {slot}")
             self._show_main_menu()
             return
 
+        self._enter_overworld_with_data(slot, data)
+
+    def _enter_overworld_with_data(self, slot, data):
+        """Enter the overworld with save data already in memory."""
+        self._hide_all_screens()
+
+        self.current_save_data = data
         self.current_slot = slot
         self.gm.load_save_data(self.current_save_data)
         self.gm.transition_to(GameState.OVERWORLD)
@@ -338,17 +530,18 @@ class NihongoQuestApp:
         self.progression = ProgressionTracker(self.current_save_data)
 
         # Show HUD
-        self.hud.show()
-        self.hud.update_stats(self.current_save_data)
+        hud = self._get_hud()
+        hud.show()
+        hud.update_stats(self.current_save_data)
 
         # Create and show overworld
         if HAS_OVERWORLD:
             try:
-                if self.overworld:
-                    self.overworld.hide()
-                self.overworld = Overworld(
-                    on_enter_monument=self._on_enter_monument,
-                )
+                # One Overworld for the session; show() builds it once, then refreshes it
+                if self.overworld is None:
+                    self.overworld = Overworld(
+                        on_enter_monument=self._on_enter_monument,
+                    )
                 self.overworld.show(self.current_save_data)
             except Exception as e:
                 logger.error(f"Overworld creation failed: {e}")
@@ -367,15 +560,37 @@ class NihongoQuestApp:
         """Simple fallback if overworld module isn't available."""
         logger.info("Using fallback overworld display")
 
+        if self._fallback_entities is None:
+            self._build_overworld_fallback()
+
+        # Refresh lock state on the cached buttons
+        for mid, btn in self._fallback_buttons:
+            is_unlocked = self.gm.is_monument_unlocked(mid)
+            btn.color = _MON_UNLOCK_BG if is_unlocked else _MON_LOCK_BG
+            btn.text_color = _MON_UNLOCK_FG if is_unlocked else _MON_LOCK_FG
+            if is_unlocked:
+                btn.on_click = lambda m=mid: self._on_enter_monument(m)
+                btn.tooltip = None
+            else:
+                btn.on_click = None
+                btn.tooltip = self._fallback_tooltip(mid)
+
+        for e in self._fallback_entities:
+            e.enabled = True
+
+    def _build_overworld_fallback(self):
+        """Create the fallback monument selection UI (once; shown / hidden after)."""
         # Create a simple monument selection UI
         self._fallback_entities = []
+        self._fallback_buttons = []
+        self._fallback_tooltips = {}
 
         title = Text(
             text="Nihongo Quest - Overworld",
             position=(0, 0.42),
             origin=(0, 0),
             scale=2,
-            color=color.rgb(255, 215, 0),
+            color=_FALLBACK_TITLE_COLOR,
             parent=camera.ui,
         )
         self._fallback_entities.append(title)
@@ -385,64 +600,57 @@ class NihongoQuestApp:
             position=(0, 0.35),
             origin=(0, 0),
             scale=1.2,
-            color=color.rgb(200, 200, 200),
+            color=_FALLBACK_SUBTITLE_COLOR,
             parent=camera.ui,
         )
         self._fallback_entities.append(subtitle)
 
         # Create monument buttons in a grid
-        monuments_per_row = 4
-        start_x = -0.45
-        start_y = 0.2
-        btn_width = 0.22
-        btn_height = 0.12
-        padding = 0.02
-
-        for mid, mdata in MONUMENTS.items():
-            row = mid // monuments_per_row
-            col = mid % monuments_per_row
-            x = start_x + col * (btn_width + padding)
-            y = start_y - row * (btn_height + padding)
-
-            is_unlocked = self.gm.is_monument_unlocked(mid)
-
-            btn_color = color.rgb(139, 0, 0) if is_unlocked else color.rgb(60, 60, 60)
-            text_color = color.rgb(255, 215, 0) if is_unlocked else color.rgb(120, 120, 120)
-
+        for mid, label, position in _FALLBACK_GRID:
+            # Colors, click handler and tooltip are set per visit
             btn = Button(
-                text=f"{mdata['name_jp']}\n{mdata['name']}",
-                position=(x, y),
-                scale=(btn_width, btn_height),
-                color=btn_color,
-                text_color=text_color,
+                text=label,
+                position=position,
+                scale=(_FALLBACK_BTN_WIDTH, _FALLBACK_BTN_HEIGHT),
                 parent=camera.ui,
                 origin=(-0.5, 0.5),
             )
 
-            if is_unlocked:
-                monument_id = mid  # Capture for closure
-                btn.on_click = lambda m=monument_id: self._on_enter_monument(m)
-            else:
-                btn.tooltip = Tooltip(f"Complete {MONUMENTS.get(mid - 1, {}).get('name', '???')} to unlock")
-
             self._fallback_entities.append(btn)
+            self._fallback_buttons.append((mid, btn))
 
         # Back to menu button
         back_btn = Button(
             text="Save & Return to Menu",
             position=(0, -0.42),
             scale=(0.3, 0.06),
-            color=color.rgb(80, 80, 80),
+            color=_FALLBACK_BACK_BG,
             text_color=color.white,
             parent=camera.ui,
         )
         back_btn.on_click = self._save_and_return_to_menu
         self._fallback_entities.append(back_btn)
 
+        self._hide_callbacks.append(self._hide_overworld_fallback)
+
+    def _fallback_tooltip(self, mid):
+        """The "complete X to unlock" tooltip for a locked fallback button (cached)."""
+        tooltip = self._fallback_tooltips.get(mid)
+        if tooltip is None:
+            tooltip = self._fallback_tooltips[mid] = Tooltip(_UNLOCK_HINTS[mid])
+        return tooltip
+
+    def _hide_overworld_fallback(self):
+        """Hide the fallback overworld UI (kept for the next visit)."""
+        if self._fallback_entities:
+            for e in self._fallback_entities:
+                e.enabled = False
+
     def _show_welcome_dialog(self, player_name):
         """Show a welcome dialog for new players."""
-        self.dialog.show()
-        self.dialog.show_dialog(
+        dialog = self._get_dialog()
+        dialog.show()
+        dialog.show_dialog(
             speaker="Sensei",
             text=f"Welcome, {player_name}! I am your guide on this journey "
                  f"to master the Japanese language. Your adventure begins at "
@@ -466,10 +674,7 @@ class NihongoQuestApp:
         # Hide overworld
         if self.overworld and hasattr(self.overworld, 'hide'):
             self.overworld.hide()
-        if hasattr(self, '_fallback_entities'):
-            for e in self._fallback_entities:
-                destroy(e)
-            self._fallback_entities = []
+        self._hide_overworld_fallback()
 
         # Show lesson select
         try:
@@ -493,10 +698,29 @@ class NihongoQuestApp:
             self.lesson_select = None
 
         # Auto-save
-        if self.current_save_data and self.current_slot:
-            save_game(self.current_slot, self.current_save_data)
+        self._save_current()
+
+        self._resume_overworld()
 
-        self._load_and_enter_overworld(self.current_slot)
+    def _resume_overworld(self):
+        """Re-show the overworld for the save already in memory (no reload from disk)."""
+        self._hide_all_screens()
+        self.gm.transition_to(GameState.OVERWORLD)
+
+        hud = self._get_hud()
+        hud.show()
+        hud.update_stats(self.current_save_data)
+
+        if self.overworld:
+            try:
+                # Already built: show() re-enables it and applies the new
+                # progress to the existing monuments / player in place
+                self.overworld.show(self.current_save_data)
+            except Exception as e:
+                logger.error(f"Overworld restore failed: {e}")
+                self._show_overworld_fallback()
+        else:
+            self._show_overworld_fallback()
 
     def _on_minigame_complete(self, score, max_score, correct_items, wrong_items):
         """Called when a minigame finishes."""
@@ -509,35 +733,32 @@ class NihongoQuestApp:
             else:
                 self.progression.award_xp('minigame_complete')
 
-            # Update mastery for correct items
-            for item in correct_items:
-                if isinstance(item, str) and len(item) <= 3:
-                    self.progression.record_character_answer('hiragana', item, True)
+            # Update mastery for correct hiragana items
+            items = [item for item in correct_items if type(item) is str and item in HIRAGANA_SET]
+            if items:
+                self.progression.record_character_answers('hiragana', items, True)
 
         # Update HUD
-        self.hud.update_stats(self.current_save_data)
+        hud = self._get_hud()
+        hud.update_stats(self.current_save_data)
 
         # Show notification
         percentage = int(score / max_score * 100) if max_score > 0 else 0
-        self.hud.show_notification(f"Score: {score}/{max_score} ({percentage}%)")
+        hud.show_notification(f"Score: {score}/{max_score} ({percentage}%)")
 
         # Auto-save
-        if self.current_save_data and self.current_slot:
-            save_game(self.current_slot, self.current_save_data)
+        self._save_current()
 
     def _save_and_return_to_menu(self):
         """Save current progress and return to main menu."""
         if self.current_save_data and self.current_slot:
             # Update play time
             self.gm.update_play_time_in_save()
-            save_game(self.current_slot, self.current_save_data)
-            logger.info(f"Game saved to slot {self.current_slot}")
+            self._save_current()
+            logger.info(f"Saving game to slot {self.current_slot}")
 
-        # Clean up fallback entities
-        if hasattr(self, '_fallback_entities'):
-            for e in self._fallback_entities:
-                destroy(e)
-            self._fallback_entities = []
+        # Hide fallback entities
+        self._hide_overworld_fallback()
 
         self.current_save_data = None
         self.current_slot = None
@@ -551,11 +772,24 @@ class NihongoQuestApp:
 game_app = None
 
 
+def _noop():
+    pass
+
+
+# Per-frame work of the active screen; swapped on screen transitions so
+# update() does no lookups of its own.
+_frame_hook = _noop
+
+
+def _set_frame_hook(hook):
+    """Run ``hook`` every frame from now on (``None`` for nothing)."""
+    global _frame_hook
+    _frame_hook = hook or _noop
+
+
 def update():
     """Called every frame by Ursina."""
-    if game_app and game_app.character_creation:
-        if hasattr(game_app.character_creation, 'update') and game_app.gm.current_state == GameState.CHARACTER_CREATION:
-            game_app.character_creation.update()
+    _frame_hook()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -12,13 +12,20 @@ Available minigames:
     - ListeningMinigame: Identify characters from romaji pronunciation
 """
 
+import importlib
+
 from .base_minigame import BaseMinigame
-from .character_match import CharacterMatchMinigame
-from .memory_cards import MemoryCardsMinigame
-from .quiz_game import QuizMinigame
-from .typing_challenge import TypingChallengeMinigame
-from .sentence_builder import SentenceBuilderMinigame
-from .listening_game import ListeningMinigame
+
+# Minigame classes are imported on first attribute access (PEP 562), so
+# importing the package does not load all six minigame modules up front.
+_LAZY_MINIGAMES = {
+    'CharacterMatchMinigame': 'character_match',
+    'MemoryCardsMinigame': 'memory_cards',
+    'QuizMinigame': 'quiz_game',
+    'TypingChallengeMinigame': 'typing_challenge',
+    'SentenceBuilderMinigame': 'sentence_builder',
+    'ListeningMinigame': 'listening_game',
+}
 
 __all__ = [
     'BaseMinigame',
@@ -29,3 +36,16 @@ __all__ = [
     'SentenceBuilderMinigame',
     'ListeningMinigame',
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_MINIGAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module('.' + module_name, __name__), name)
+    globals()[name] = value     # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,6 +12,9 @@ Subclasses must implement:
 
 from ursina import *
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import defaultdict
+from functools import partial
 import math
 
 
@@ -32,13 +35,53 @@ COLOR_BUTTON        = color.rgb(60, 60, 90)
 COLOR_BUTTON_HOVER  = color.rgb(80, 80, 120)
 COLOR_TIMER_BAR     = color.rgb(250, 180, 50)
 COLOR_TIMER_LOW     = color.rgb(235, 87, 87)
+COLOR_TIMER_MID     = color.rgb(250, 210, 80)
 COLOR_STREAK        = color.rgb(255, 170, 50)
 COLOR_CARD_BACK     = color.rgb(180, 50, 50)
+COLOR_DIM_STAR      = color.rgb(60, 60, 80)
+
+# Difficulty name -> index into (easy, normal, hard) tuples; unknown names
+# fall back to normal
+_DIFF_IDX = {'easy': 0, 'normal': 1, 'hard': 2}
+_TIME_LIMITS = (120, 90, 60)
+
+# Timer bar colour per band: < 25% left, < 50% left, otherwise
+_TIMER_BAND_COLORS = (COLOR_TIMER_LOW, COLOR_TIMER_MID, COLOR_TIMER_BAR)
+
+# Score fraction needed for each of the 1..5 stars
+_STAR_THRESHOLDS = (0.20, 0.45, 0.65, 0.80, 0.95)
+
+# Score-card star x positions
+_STAR_XS = tuple(-0.12 + i * 0.06 for i in range(5))
+
+# Result flash tints (palette colour at ~40% alpha) and the fade target
+_FLASH_CORRECT = color.rgba(COLOR_CORRECT.r * 255, COLOR_CORRECT.g * 255,
+                            COLOR_CORRECT.b * 255, 100)
+_FLASH_WRONG = color.rgba(COLOR_WRONG.r * 255, COLOR_WRONG.g * 255,
+                          COLOR_WRONG.b * 255, 100)
+_FADED = color.rgba(0, 0, 0, 0)
+
+
+def _build_star_row():
+    """Score-card row of five star Texts under one parent, pooled as a unit."""
+    row = Entity(parent=camera.ui)
+    row.stars = [
+        Text(text='*', parent=row, origin=(0, 0), position=(x, 0.17),
+             scale=4, z=-10)
+        for x in _STAR_XS
+    ]
+    return row
 
 
 class BaseMinigame(ABC):
     """Base class for all minigames in Nihongo Quest."""
 
+    # Hidden feedback / score-card entities keyed by kind, shared by every
+    # minigame.  Round transitions re-initialise these instead of building
+    # and destroying new NodePaths; _release() strips anything tied to the
+    # minigame that used them.
+    _pool = defaultdict(list)
+
     # ------------------------------------------------------------------
     # Initialisation
     # ------------------------------------------------------------------
@@ -55,6 +98,7 @@ class BaseMinigame(ABC):
         """
         self.lesson_data = lesson_data
         self.difficulty = difficulty
+        self._diff_idx = _DIFF_IDX.get(difficulty, 1)
         self.on_complete = on_complete
 
         # Scoring
@@ -66,6 +110,7 @@ class BaseMinigame(ABC):
         # Entity management
         self.entities = []          # every entity created via helpers
         self._ui_entities = []      # subset: HUD / overlay elements
+        self._pooled = []           # entities on loan from the pool
 
         # State
         self.is_active = False
@@ -77,18 +122,25 @@ class BaseMinigame(ABC):
         # Background overlay (dims the 3-D world)
         self._bg = None
 
+        # Result flash / label, held from show() to hide()
+        self._flash = None
+        self._result_label = None
+        self._result_serial = 0
+
+        # Running shakes: [entity, orig_x, elapsed, duration, magnitude]
+        self._active_shakes = []
+        self._shake_driver = None
+
     # ------------------------------------------------------------------
     # Difficulty helpers
     # ------------------------------------------------------------------
     def _get_time_limit(self):
         """Return time limit in seconds based on difficulty."""
-        limits = {'easy': 120, 'normal': 90, 'hard': 60}
-        return limits.get(self.difficulty, 90)
+        return _TIME_LIMITS[self._diff_idx]
 
     def _difficulty_value(self, easy, normal, hard):
         """Return *easy*, *normal*, or *hard* depending on self.difficulty."""
-        return {'easy': easy, 'normal': normal, 'hard': hard}.get(
-            self.difficulty, normal)
+        return (easy, normal, hard)[self._diff_idx]
 
     # ------------------------------------------------------------------
     # Abstract interface
@@ -108,16 +160,23 @@ class BaseMinigame(ABC):
         """Activate the minigame and run setup()."""
         self.is_active = True
         self._create_background()
+        self._create_result_feedback()
         self.setup()
 
     def hide(self):
         """Tear down all created entities."""
         self.is_active = False
+        for e in self._pooled[::-1]:
+            self._release(e)
         for e in self.entities:
             if e is not None:
                 destroy(e)
         self.entities.clear()
         self._ui_entities.clear()
+        self._active_shakes.clear()
+        self._shake_driver = None
+        self._flash = None
+        self._result_label = None
         if self._bg:
             destroy(self._bg)
             self._bg = None
@@ -198,6 +257,54 @@ class BaseMinigame(ABC):
         )
         self.entities.append(self._bg)
 
+    def _create_result_feedback(self):
+        """Take the flash quad and label every _show_result reuses (hidden until then)."""
+        self._flash = self._acquire_quad('flash', scale=(2, 2), z=-5)
+        self._flash.enabled = False
+        self._result_label = self._acquire_text('feedback', z=-6)
+        self._result_label.enabled = False
+
+    # ------------------------------------------------------------------
+    # Entity pool
+    # ------------------------------------------------------------------
+    def _acquire(self, kind, factory, **attrs):
+        """Take a pooled entity of *kind* (or build one with *factory*) and apply *attrs*."""
+        free = self._pool[kind]
+        if free:
+            e = free.pop()
+            for name, value in attrs.items():
+                setattr(e, name, value)
+            e.enabled = True
+        else:
+            e = factory(**attrs)
+        e._pool_kind = kind
+        self._pooled.append(e)
+        return e
+
+    def _acquire_text(self, kind, **attrs):
+        """Pooled centred Text on camera.ui."""
+        return self._acquire(kind, partial(Text, parent=camera.ui, origin=(0, 0)), **attrs)
+
+    def _acquire_quad(self, kind, **attrs):
+        """Pooled quad Entity on camera.ui."""
+        return self._acquire(kind, partial(Entity, parent=camera.ui, model='quad'), **attrs)
+
+    def _release(self, e):
+        """Hide *e*, drop its per-use state and park it for reuse."""
+        kind = getattr(e, '_pool_kind', None)
+        if kind is None:
+            return
+        e._pool_kind = None
+        e.enabled = False
+        # The pool outlives this minigame: don't let a parked entity keep
+        # its bound callback (and with it the whole minigame) or its text.
+        if isinstance(e, Button):
+            e.on_click = None
+        elif isinstance(e, Text):
+            e.text = ''
+        self._pooled.remove(e)
+        self._pool[kind].append(e)
+
     # ------------------------------------------------------------------
     # Timer bar
     # ------------------------------------------------------------------
@@ -224,19 +331,26 @@ class BaseMinigame(ABC):
         )
         self.entities.append(bar)
         self._timer_bar = bar
+        self._timer_bar_band = 2
+        self._timer_bar_frac = 1.0
         return bar
 
     def _update_timer_bar(self, fraction):
-        """Set the timer bar width (0..1) and colour."""
+        """Set the timer bar width (0..1) and colour.
+
+        Only writes to the entity when the colour band changes or the width
+        moves by a visible amount.
+        """
         if not hasattr(self, '_timer_bar'):
             return
-        self._timer_bar.scale_x = 0.9 * max(0, min(1, fraction))
-        if fraction < 0.25:
-            self._timer_bar.color = COLOR_TIMER_LOW
-        elif fraction < 0.5:
-            self._timer_bar.color = color.rgb(250, 210, 80)
-        else:
-            self._timer_bar.color = COLOR_TIMER_BAR
+        fraction = max(0, min(1, fraction))
+        if abs(fraction - self._timer_bar_frac) * 0.9 > 0.002:
+            self._timer_bar_frac = fraction
+            self._timer_bar.scale_x = 0.9 * fraction
+        band = 0 if fraction < 0.25 else (1 if fraction < 0.5 else 2)
+        if band != self._timer_bar_band:
+            self._timer_bar_band = band
+            self._timer_bar.color = _TIMER_BAND_COLORS[band]
 
     # ------------------------------------------------------------------
     # Visual feedback
@@ -245,54 +359,65 @@ class BaseMinigame(ABC):
         """Flash the screen green/red and show a small label."""
         flash_color = COLOR_CORRECT if is_correct else COLOR_WRONG
         label_text = 'Correct!' if is_correct else 'Wrong'
+        if self._flash is None:     # late callback after hide()
+            return
+        self._result_serial += 1
 
-        flash = Entity(
-            parent=camera.ui,
-            model='quad',
-            color=color.rgba(flash_color.r * 255, flash_color.g * 255,
-                             flash_color.b * 255, 100),
-            scale=(2, 2),
-            z=-5,
-        )
-        self.entities.append(flash)
-        flash.animate('color', color.rgba(0, 0, 0, 0), duration=duration,
+        flash = self._flash
+        flash.color = _FLASH_CORRECT if is_correct else _FLASH_WRONG
+        flash.enabled = True
+        flash.animate('color', _FADED, duration=duration,
                        curve=curve.out_expo)
-        destroy(flash, delay=duration + 0.1)
 
-        lbl = Text(
-            text=f'{label_text}  {item_text}',
-            parent=camera.ui,
-            origin=(0, 0),
-            scale=2.5 if is_correct else 2,
-            color=flash_color,
-            z=-6,
-        )
-        self.entities.append(lbl)
-        lbl.animate('y', lbl.y + 0.05, duration=duration,
+        lbl = self._result_label
+        lbl.text = f'{label_text}  {item_text}'
+        lbl.position = (0, 0)
+        lbl.scale = 2.5 if is_correct else 2
+        lbl.color = flash_color
+        lbl.enabled = True
+        lbl.animate('y', 0.05, duration=duration,
                      curve=curve.out_expo)
-        lbl.animate('color', color.rgba(0, 0, 0, 0), duration=duration,
+        lbl.animate('color', _FADED, duration=duration,
                      curve=curve.out_expo)
-        destroy(lbl, delay=duration + 0.1)
+        invoke(self._end_result, self._result_serial, delay=duration + 0.1)
+
+    def _end_result(self, serial):
+        """Hide the flash and label, unless a newer result has reused them."""
+        if serial == self._result_serial and self._flash is not None:
+            self._flash.enabled = False
+            self._result_label.enabled = False
 
     def _shake_entity(self, entity, magnitude=0.01, duration=0.3):
         """Quick horizontal shake animation on *entity*."""
         if entity is None:
             return
-        orig_x = entity.x
-        seq = Sequence(
-            Func(setattr, entity, 'x', orig_x + magnitude),
-            Wait(duration / 6),
-            Func(setattr, entity, 'x', orig_x - magnitude),
-            Wait(duration / 6),
-            Func(setattr, entity, 'x', orig_x + magnitude * 0.6),
-            Wait(duration / 6),
-            Func(setattr, entity, 'x', orig_x - magnitude * 0.6),
-            Wait(duration / 6),
-            Func(setattr, entity, 'x', orig_x + magnitude * 0.2),
-            Wait(duration / 6),
-            Func(setattr, entity, 'x', orig_x),
-        )
-        seq.start()
+        for shake in self._active_shakes:
+            if shake[0] is entity:
+                # Restart around the resting x, not the mid-shake one
+                shake[2:] = [0.0, duration, magnitude]
+                return
+        if self._shake_driver is None:
+            self._shake_driver = self._create_entity(
+                name='minigame_shakes', update=self._step_shakes)
+        self._active_shakes.append([entity, entity.x, 0.0, duration, magnitude])
+
+    def _step_shakes(self):
+        """Advance every running shake by one frame (driver entity update)."""
+        shakes = self._active_shakes
+        if not shakes:
+            return
+        dt = time.dt
+        for i in range(len(shakes) - 1, -1, -1):
+            shake = shakes[i]
+            entity, orig_x, elapsed, duration, magnitude = shake
+            elapsed += dt
+            if elapsed >= duration:
+                entity.x = orig_x
+                del shakes[i]
+                continue
+            shake[2] = elapsed
+            k = elapsed / duration
+            entity.x = orig_x + magnitude * math.cos(k * 6 * math.pi) * (1 - k)
 
     # ------------------------------------------------------------------
     # Score card overlay
@@ -301,151 +426,108 @@ class BaseMinigame(ABC):
         """Return 1-5 star rating based on score / max_score."""
         if self.max_score == 0:
             return 0
-        pct = self.score / self.max_score
-        if pct >= 0.95:
-            return 5
-        elif pct >= 0.80:
-            return 4
-        elif pct >= 0.65:
-            return 3
-        elif pct >= 0.45:
-            return 2
-        elif pct >= 0.20:
-            return 1
-        return 0
+        return bisect_right(_STAR_THRESHOLDS, self.score / self.max_score)
 
     def _show_score_card(self):
         """Display the end-of-round score card with stars, retry, continue."""
         # Dim background a bit more
-        overlay = Entity(
-            parent=camera.ui,
-            model='quad',
+        self._acquire_quad(
+            'overlay',
             color=color.rgba(5, 5, 15, 200),
             scale=(2, 2),
             z=-8,
         )
-        self.entities.append(overlay)
 
         # Card panel
-        card = Entity(
-            parent=camera.ui,
-            model='quad',
+        self._acquire_quad(
+            'card',
             color=COLOR_PANEL,
             scale=(0.7, 0.7),
             z=-9,
         )
-        self.entities.append(card)
 
         # Title
         pct = int((self.score / self.max_score * 100) if self.max_score else 0)
         title_text = 'Perfect!' if pct >= 95 else (
             'Great Job!' if pct >= 70 else (
             'Good Effort!' if pct >= 40 else 'Keep Practicing!'))
-        title = Text(
+        self._acquire_text(
+            'label',
             text=title_text,
-            parent=camera.ui,
-            origin=(0, 0),
-            y=0.25,
+            position=(0, 0.25),
             scale=3,
             color=COLOR_ACCENT,
             z=-10,
         )
-        self.entities.append(title)
 
         # Stars
         stars = self._get_star_rating()
-        star_colors = [COLOR_GOLD] * stars + [color.rgb(60, 60, 80)] * (5 - stars)
-        for i in range(5):
-            sx = -0.12 + i * 0.06
-            star = Text(
-                text='*',
-                parent=camera.ui,
-                origin=(0, 0),
-                position=(sx, 0.17),
-                scale=4,
-                color=star_colors[i],
-                z=-10,
-            )
-            self.entities.append(star)
+        row = self._acquire('star_row', _build_star_row)
+        for i, star in enumerate(row.stars):
+            star.color = COLOR_GOLD if i < stars else COLOR_DIM_STAR
 
         # Score / stats
-        score_label = Text(
+        self._acquire_text(
+            'label',
             text=f'Score:  {self.score} / {self.max_score}  ({pct}%)',
-            parent=camera.ui,
-            origin=(0, 0),
-            y=0.08,
+            position=(0, 0.08),
             scale=1.8,
             color=COLOR_TEXT,
             z=-10,
         )
-        self.entities.append(score_label)
 
-        correct_label = Text(
+        self._acquire_text(
+            'label',
             text=f'Correct: {len(self.correct_items)}    '
                  f'Wrong: {len(self.wrong_items)}    '
                  f'Hints: {self.hints_used}',
-            parent=camera.ui,
-            origin=(0, 0),
-            y=0.02,
+            position=(0, 0.02),
             scale=1.3,
             color=COLOR_TEXT_DIM,
             z=-10,
         )
-        self.entities.append(correct_label)
 
         # Wrong items review (scrollable area, up to 6 shown)
         if self.wrong_items:
-            review_title = Text(
+            self._acquire_text(
+                'label',
                 text='Review these:',
-                parent=camera.ui,
-                origin=(0, 0),
-                y=-0.06,
+                position=(0, -0.06),
                 scale=1.3,
                 color=COLOR_WRONG,
                 z=-10,
             )
-            self.entities.append(review_title)
             for idx, item in enumerate(self.wrong_items[:6]):
                 line = item if isinstance(item, str) else str(item)
-                row = Text(
+                self._acquire_text(
+                    'label',
                     text=line,
-                    parent=camera.ui,
-                    origin=(0, 0),
-                    y=-0.11 - idx * 0.035,
+                    position=(0, -0.11 - idx * 0.035),
                     scale=1.1,
                     color=COLOR_TEXT_DIM,
                     z=-10,
                 )
-                self.entities.append(row)
 
-        # Buttons
-        retry_btn = Button(
-            text='Retry',
-            parent=camera.ui,
-            scale=(0.18, 0.055),
-            position=(-0.12, -0.28),
+        # Buttons (style is fixed per kind; only colour and callback reset)
+        self._acquire(
+            'retry_button',
+            partial(Button, text='Retry', parent=camera.ui,
+                    scale=(0.18, 0.055), position=(-0.12, -0.28),
+                    highlight_color=COLOR_BUTTON_HOVER,
+                    text_color=COLOR_TEXT, radius=0.25, z=-10),
             color=COLOR_BUTTON,
-            highlight_color=COLOR_BUTTON_HOVER,
-            text_color=COLOR_TEXT,
-            radius=0.25,
-            z=-10,
+            on_click=self._on_retry,
         )
-        retry_btn.on_click = self._on_retry
-        self.entities.append(retry_btn)
 
-        continue_btn = Button(
-            text='Continue',
-            parent=camera.ui,
-            scale=(0.18, 0.055),
-            position=(0.12, -0.28),
+        self._acquire(
+            'continue_button',
+            partial(Button, text='Continue', parent=camera.ui,
+                    scale=(0.18, 0.055), position=(0.12, -0.28),
+                    highlight_color=color.rgb(170, 200, 255),
+                    text_color=color.rgb(20, 20, 40), radius=0.25, z=-10),
             color=COLOR_ACCENT,
-            highlight_color=color.rgb(170, 200, 255),
-            text_color=color.rgb(20, 20, 40),
-            radius=0.25,
-            z=-10,
+            on_click=self._on_continue,
         )
-        continue_btn.on_click = self._on_continue
-        self.entities.append(continue_btn)
 
     def _on_retry(self):
         """Reset state and re-run the minigame."""
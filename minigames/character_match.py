@@ -23,6 +23,7 @@ Difficulty scaling
 """
 
 from ursina import *
+from functools import partial
 import random
 import math
 
@@ -33,6 +34,9 @@ from .base_minigame import (
     COLOR_TIMER_BAR,
 )
 
+# Timer bar redraw period; a 5-12 s countdown needs no more than 20 Hz
+_BAR_REDRAW_INTERVAL = 0.05
+
 
 class CharacterMatchMinigame(BaseMinigame):
     """Match Japanese characters to their romaji readings."""
@@ -58,9 +62,23 @@ class CharacterMatchMinigame(BaseMinigame):
             self.queue = (all_chars * math.ceil(self.num_rounds / len(all_chars)))[:self.num_rounds]
 
         self.all_chars = all_chars
+
+        # Wrong-answer candidates per romaji, padded with dummies when the
+        # character pool is smaller than the number of wrong buttons
+        n_wrong = self.num_choices - 1
+        romajis = [c['romaji'] for c in all_chars]
+        self._wrong_by_romaji = {}
+        for r in set(romajis):
+            wrong_pool = tuple(x for x in romajis if x != r)
+            if len(wrong_pool) < n_wrong:
+                wrong_pool += ('--',) * (n_wrong - len(wrong_pool))
+            self._wrong_by_romaji[r] = wrong_pool
+
         self.current_index = 0
         self.max_score = self.num_rounds * 10
         self.answered = False
+        self._update_active = False     # True only while a round is counting down
+        self._bar_accum = 0.0
         self.round_timer = 0.0
         self.show_correct_timer = 0.0
         self.showing_correct = False
@@ -105,6 +123,7 @@ class CharacterMatchMinigame(BaseMinigame):
             bx = start_x + i * (0.7 / self.num_choices)
             btn = self._create_button(
                 text='',
+                on_click=partial(self._on_answer, i),
                 position=(bx, -0.15),
                 scale=(btn_width - 0.01, 0.07),
                 z=-2,
@@ -139,6 +158,9 @@ class CharacterMatchMinigame(BaseMinigame):
         self.answered = False
         self.showing_correct = False
         self.round_timer = self.time_per_char
+        self._update_active = True
+        self._bar_accum = 0.0
+        self._update_timer_bar(1.0)
         self.feedback_label.text = ''
 
         # Update character display
@@ -146,22 +168,15 @@ class CharacterMatchMinigame(BaseMinigame):
         self.char_display.color = COLOR_TEXT
 
         # Build choices: 1 correct + (num_choices-1) wrong
-        wrong_pool = [c['romaji'] for c in self.all_chars
-                      if c['romaji'] != self.current_romaji]
-        if len(wrong_pool) < self.num_choices - 1:
-            # pad with dummy romaji if pool is too small
-            wrong_pool += ['--'] * (self.num_choices - 1 - len(wrong_pool))
-        wrong = random.sample(wrong_pool, self.num_choices - 1)
-        choices = wrong + [self.current_romaji]
-        random.shuffle(choices)
-
-        self.correct_button_index = choices.index(self.current_romaji)
+        choices = random.sample(self._wrong_by_romaji[self.current_romaji],
+                                self.num_choices - 1)
+        self.correct_button_index = random.randrange(self.num_choices)
+        choices.insert(self.correct_button_index, self.current_romaji)
 
         for i, btn in enumerate(self.answer_buttons):
             btn.text = choices[i]
             btn.color = COLOR_BUTTON
             btn.highlight_color = COLOR_BUTTON_HOVER
-            btn.on_click = lambda idx=i: self._on_answer(idx)
 
         # Update progress
         self.progress_text.text = f'{self.current_index + 1} / {self.num_rounds}'
@@ -175,6 +190,7 @@ class CharacterMatchMinigame(BaseMinigame):
             return
 
         self.answered = True
+        self._update_active = False
         is_correct = (index == self.correct_button_index)
 
         if is_correct:
@@ -210,6 +226,7 @@ class CharacterMatchMinigame(BaseMinigame):
         if self.answered:
             return
         self.answered = True
+        self._update_active = False
         self.wrong_items.append(
             f'{self.current_char} = {self.current_romaji} (time out)')
         self.answer_buttons[self.correct_button_index].color = COLOR_CORRECT
@@ -229,12 +246,17 @@ class CharacterMatchMinigame(BaseMinigame):
     # Frame update
     # ------------------------------------------------------------------
     def update(self):
-        if not self.is_active or self.answered:
+        if not self._update_active or not self.is_active:
             return
 
-        self.round_timer -= time.dt
-        fraction = max(0, self.round_timer / self.time_per_char)
-        self._update_timer_bar(fraction)
-
+        dt = time.dt
+        self.round_timer -= dt
         if self.round_timer <= 0:
+            self._update_timer_bar(0)
             self._time_expired()
+            return
+
+        self._bar_accum += dt
+        if self._bar_accum >= _BAR_REDRAW_INTERVAL:
+            self._bar_accum = 0.0
+            self._update_timer_bar(self.round_timer / self.time_per_char)
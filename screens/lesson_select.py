@@ -18,12 +18,7 @@ Public interface
 
 from ursina import *
 
-from minigames.character_match import CharacterMatchMinigame
-from minigames.memory_cards import MemoryCardsMinigame
-from minigames.quiz_game import QuizMinigame
-from minigames.typing_challenge import TypingChallengeMinigame
-from minigames.sentence_builder import SentenceBuilderMinigame
-from minigames.listening_game import ListeningMinigame
+import minigames
 
 from content.hiragana import (
     HIRAGANA_BASIC, HIRAGANA_DAKUTEN, HIRAGANA_COMBOS, HIRAGANA_LESSONS,
@@ -91,20 +86,21 @@ COLOR_LOCKED        = color.rgb(80, 80, 80)
 COLOR_STAR_FILLED   = color.rgb(255, 215, 0)
 COLOR_STAR_EMPTY    = color.rgb(60, 60, 80)
 
-# Minigame type icons (text labels used as simple "icons")
+# Minigame type icons (text labels used as simple "icons").  'class' names
+# an attribute of the minigames package, imported when first launched.
 MINIGAME_TYPES = {
     'match':   {'label': 'Match',  'color': color.rgb(120, 180, 255),
-                'class': CharacterMatchMinigame},
+                'class': 'CharacterMatchMinigame'},
     'memory':  {'label': 'Memory', 'color': color.rgb(180, 130, 255),
-                'class': MemoryCardsMinigame},
+                'class': 'MemoryCardsMinigame'},
     'quiz':    {'label': 'Quiz',   'color': color.rgb(130, 220, 170),
-                'class': QuizMinigame},
+                'class': 'QuizMinigame'},
     'type':    {'label': 'Type',   'color': color.rgb(255, 180, 120),
-                'class': TypingChallengeMinigame},
+                'class': 'TypingChallengeMinigame'},
     'build':   {'label': 'Build',  'color': color.rgb(255, 220, 100),
-                'class': SentenceBuilderMinigame},
+                'class': 'SentenceBuilderMinigame'},
     'listen':  {'label': 'Listen', 'color': color.rgb(255, 140, 160),
-                'class': ListeningMinigame},
+                'class': 'ListeningMinigame'},
 }
 
 
@@ -1193,7 +1189,7 @@ class LessonSelectScreen:
         if info is None:
             return
 
-        mg_class = info['class']
+        mg_class = getattr(minigames, info['class'])
 
         def on_complete(score, max_score, correct, wrong):
             """Handle minigame completion."""
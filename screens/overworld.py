@@ -15,8 +15,8 @@ Features:
 
 Public interface:
     overworld = Overworld()
-    overworld.show(save_data)
-    overworld.hide()
+    overworld.show(save_data)   # builds on first call, refreshes in place after
+    overworld.hide()            # hides, keeps the world built
 """
 
 from ursina import *
@@ -26,7 +26,7 @@ import os
 
 # Resolve imports for both package and standalone execution
 from entities.player import PlayerCharacter
-from entities.monument import Monument, MONUMENT_INFO
+from entities.monument import Monument
 from entities.npc import NPC
 
 # Try to import shared UI components; fall back to local constants
@@ -104,6 +104,25 @@ def _generate_path_positions(count=13, amplitude=25, wavelength=50,
 # Pre-compute the monument positions for the winding path layout
 MONUMENT_POSITIONS = _generate_path_positions()
 
+# Base sky color (window clear color behind the sky spheres)
+_SKY_BASE_COLOR = color.rgb(60, 30, 70)
+
+
+def _monument_state(save_data, monument_id):
+    """``(is_unlocked, completion)`` of a monument in ``save_data``."""
+    monuments_data = save_data.get('monuments', {})
+    mon_data = monuments_data.get(str(monument_id), monuments_data.get(monument_id, {}))
+    # Unlocking logic: monument is unlocked if its index <= current_monument
+    # or if explicitly unlocked in save data
+    is_unlocked = mon_data.get('unlocked', monument_id <= save_data.get('current_monument', 0))
+    return is_unlocked, mon_data.get('completion', 0.0)
+
+
+def _start_position(save_data):
+    """Position of the monument the player is currently at."""
+    current = save_data.get('current_monument', 0)
+    return MONUMENT_POSITIONS[min(current, len(MONUMENT_POSITIONS) - 1)]
+
 
 class Overworld:
     """
@@ -114,6 +133,10 @@ class Overworld:
         ow.show(save_data_dict)
         # ...later...
         ow.hide()
+
+    The world is built on the first show() and only hidden by hide(); later
+    show() calls update the existing monuments and player from the new
+    save data, so one instance serves the whole session.
     """
 
     def __init__(self, on_enter_monument=None, on_back=None):
@@ -151,47 +174,55 @@ class Overworld:
     # ─────────────────────────────────────────────
 
     def show(self, save_data=None):
-        """Build and display the overworld using the given save data."""
-        self.hide()  # clean up any previous state
+        """Display the overworld for ``save_data``, building it on first use."""
         self._visible = True
         self._save_data = save_data or {}
         self._current_monument_id = self._save_data.get('current_monument', 0)
 
+        if self._monuments:
+            self._refresh(self._save_data)
+            return
         self._create_world()
         self._place_monuments(self._save_data)
         self._create_player(self._save_data)
         self._create_npcs()
         self._setup_camera()
 
+    def _refresh(self, save_data):
+        """Re-enable the built world and bring monuments / player up to date."""
+        window.color = _SKY_BASE_COLOR
+        for ent in self._world_entities:
+            ent.enabled = True
+
+        for mid, mon in self._monuments.items():
+            is_unlocked, completion = _monument_state(save_data, mid)
+            mon.set_unlocked(is_unlocked)
+            mon.set_completion(completion)
+            mon.show()
+
+        self._player_walking = False
+        self._player.stop()                 # drop any walk left over from last visit
+        self._player.set_appearance(save_data.get('appearance'))
+        start_pos = _start_position(save_data)
+        self._player.position = (start_pos[0], 0, start_pos[2] - 3)
+        self._player.show()
+
+        self._npc_sensei.show()
+        self._setup_camera()
+
     def hide(self):
-        """Tear down all entities and reset state."""
+        """Hide the overworld; the world stays built for the next show()."""
         self._visible = False
         self._dismiss_info_panel()
 
-        # Destroy monuments
-        for mid, mon in self._monuments.items():
-            mon.destroy_monument()
-        self._monuments.clear()
-
-        # Destroy player
+        for mon in self._monuments.values():
+            mon.hide()
         if self._player:
-            self._player.destroy_character()
-            self._player = None
-
-        # Destroy NPC
+            self._player.hide()
         if self._npc_sensei:
-            self._npc_sensei.destroy_npc()
-            self._npc_sensei = None
-
-        # Destroy world entities
+            self._npc_sensei.hide()
         for ent in self._world_entities:
-            destroy(ent)
-        self._world_entities.clear()
-
-        # Reset camera
-        if self._camera_pivot:
-            destroy(self._camera_pivot)
-            self._camera_pivot = None
+            ent.enabled = False
 
     def update(self):
         """Called each frame — drives player animation and camera follow."""
@@ -215,7 +246,7 @@ class Overworld:
 
         # ── Sky background (dawn gradient) ──
         # Ursina's window.color as base sky
-        window.color = color.rgb(60, 30, 70)
+        window.color = _SKY_BASE_COLOR
 
         # Large sky sphere for gradient feel
         sky_sphere = Entity(
@@ -438,18 +469,10 @@ class Overworld:
 
     def _place_monuments(self, save_data):
         """Create and position all 13 monuments."""
-        monuments_data = save_data.get('monuments', {})
-        current_monument = save_data.get('current_monument', 0)
-
         for i in range(13):
             pos = MONUMENT_POSITIONS[i]
             name = MONUMENT_NAMES[i]
-            mon_data = monuments_data.get(str(i), monuments_data.get(i, {}))
-
-            # Unlocking logic: monument is unlocked if its index <= current_monument
-            # or if explicitly unlocked in save data
-            is_unlocked = mon_data.get('unlocked', i <= current_monument)
-            completion = mon_data.get('completion', 0.0)
+            is_unlocked, completion = _monument_state(save_data, i)
 
             monument = Monument(
                 monument_id=i,
@@ -468,8 +491,7 @@ class Overworld:
     def _create_player(self, save_data):
         """Create the player character at their current monument."""
         appearance = save_data.get('appearance', None)
-        current = save_data.get('current_monument', 0)
-        start_pos = MONUMENT_POSITIONS[min(current, len(MONUMENT_POSITIONS) - 1)]
+        start_pos = _start_position(save_data)
 
         # Position player slightly in front of monument
         player_pos = (start_pos[0], 0, start_pos[2] - 3)
@@ -501,11 +523,11 @@ class Overworld:
 
     def _setup_camera(self):
         """Third-person overhead angled camera."""
-        current = self._save_data.get('current_monument', 0)
-        start_pos = MONUMENT_POSITIONS[min(current, len(MONUMENT_POSITIONS) - 1)]
-
-        self._camera_pivot = Entity(position=(start_pos[0], 0, start_pos[2]))
-        self._world_entities.append(self._camera_pivot)
+        start_pos = _start_position(self._save_data)
+        if self._camera_pivot is None:
+            self._camera_pivot = Entity()
+            self._world_entities.append(self._camera_pivot)
+        self._camera_pivot.position = (start_pos[0], 0, start_pos[2])
 
         camera.parent = self._camera_pivot
         camera.position = (0, 30, -30)
@@ -526,7 +548,7 @@ class Overworld:
         if not monument:
             return
 
-        if not monument._is_unlocked:
+        if not monument.is_unlocked:
             # Show locked message
             self._show_locked_message(monument_id)
             return
@@ -609,11 +631,10 @@ class Overworld:
         if not monument:
             return
 
-        info = MONUMENT_INFO.get(monument_id, ('Unknown', '???', '', color.gray))
-        name_en = info[0]
-        name_jp = info[1]
-        description = info[2]
-        completion = monument._completion
+        name_en = monument.name_en
+        name_jp = monument.name_jp
+        description = monument.description
+        completion = monument.completion
 
         # ── Panel background ──
         overlay = Entity(
@@ -420,9 +420,17 @@ class TransitionScreen(Entity):
             **kwargs,
         )
         self.visible = True
+        self._send_back_seq = None     # pending _send_back of the last fade_in
+
+    def _cancel_send_back(self):
+        """Drop a pending _send_back so it can't fire in the middle of a newer fade."""
+        if self._send_back_seq is not None:
+            self._send_back_seq.kill()
+            self._send_back_seq = None
 
     def fade_out(self, duration=0.4, on_complete=None):
         """Fade screen to black."""
+        self._cancel_send_back()
         self.z = -0.5
         self.animate_color(color.rgba(0, 0, 0, 255), duration=duration,
                            curve=curve.in_out_expo)
@@ -431,14 +439,16 @@ class TransitionScreen(Entity):
 
     def fade_in(self, duration=0.4, on_complete=None):
         """Fade screen from black back to transparent."""
+        self._cancel_send_back()
         self.color = color.rgba(0, 0, 0, 255)
         self.z = -0.5
         self.animate_color(color.rgba(0, 0, 0, 0), duration=duration,
                            curve=curve.in_out_expo)
         if on_complete:
             invoke(on_complete, delay=duration)
-        invoke(self._send_back, delay=duration)
+        self._send_back_seq = invoke(self._send_back, delay=duration)
 
     def _send_back(self):
         """Move behind everything once fully transparent."""
+        self._send_back_seq = None
         self.z = 10